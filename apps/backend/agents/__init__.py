@@ -27,8 +27,11 @@ __all__ = [
     "run_agent_session",
     "post_session_processing",
     # Utils
+    "GitSession",
     "get_latest_commit",
     "get_commit_count",
+    "get_git_snapshot",
+    "invalidate_plan_cache",
     "load_implementation_plan",
     "find_subtask_in_plan",
     "find_phase_for_subtask",
@@ -72,18 +75,24 @@ def __getattr__(name):
 
         return locals()[name]
     elif name in (
+        "GitSession",
         "find_phase_for_subtask",
         "find_subtask_in_plan",
         "get_commit_count",
+        "get_git_snapshot",
         "get_latest_commit",
+        "invalidate_plan_cache",
         "load_implementation_plan",
         "sync_plan_to_source",
     ):
         from .utils import (
+            GitSession,
             find_phase_for_subtask,
             find_subtask_in_plan,
             get_commit_count,
+            get_git_snapshot,
             get_latest_commit,
+            invalidate_plan_cache,
             load_implementation_plan,
             sync_plan_to_source,
         )
@@ -22,8 +22,8 @@ from phase_event import ExecutionPhase, emit_phase
 from progress import (
     count_subtasks,
     count_subtasks_detailed,
-    get_current_phase,
-    get_next_subtask,
+    get_current_phase_in_plan,
+    get_next_subtask_in_plan,
     is_build_complete,
     print_build_complete_banner,
     print_progress_summary,
@@ -56,11 +56,14 @@ from ui import (
 
 from .base import AUTO_CONTINUE_DELAY_SECONDS, HUMAN_INTERVENTION_FILE
 from .memory_manager import debug_memory_system_status, get_graphiti_context
-from .session import post_session_processing, run_agent_session
+from .session import (
+    post_session_processing,
+    run_agent_session,
+    wait_for_memory_tasks,
+)
 from .utils import (
+    GitSession,
     find_phase_for_subtask,
-    get_commit_count,
-    get_latest_commit,
     load_implementation_plan,
     sync_plan_to_source,
 )
@@ -97,6 +100,9 @@ async def run_autonomous_agent(
     status_manager = StatusManager(project_dir)
     status_manager.set_active(spec_dir.name, BuildState.BUILDING)
 
+    # One git helper process for all before/after commit snapshots
+    git_session = GitSession(project_dir)
+
     # Initialize task logger for persistent logging
     task_logger = get_task_logger(spec_dir)
 
@@ -131,6 +137,9 @@ async def run_autonomous_agent(
     current_log_phase = LogPhase.CODING
     is_planning_phase = False
 
+    # Subtask counts from the last progress summary, to report what changed
+    progress_counts: dict | None = None
+
     if first_run:
         print_status(
             "Fresh start - will use Planner Agent to create implementation plan", "info"
@@ -163,7 +172,7 @@ async def run_autonomous_agent(
             await linear_task_started(spec_dir)
     else:
         print(f"Continuing build: {highlight(spec_dir.name)}")
-        print_progress_summary(spec_dir)
+        progress_counts = print_progress_summary(spec_dir)
 
         # Check if already complete
         if is_build_complete(spec_dir):
@@ -191,280 +200,325 @@ async def run_autonomous_agent(
     # Main loop
     iteration = 0
 
-    while True:
-        iteration += 1
-
-        # Check for human intervention (PAUSE file)
-        pause_file = spec_dir / HUMAN_INTERVENTION_FILE
-        if pause_file.exists():
-            print("\n" + "=" * 70)
-            print("  PAUSED BY HUMAN")
-            print("=" * 70)
+    # Insight extraction and memory saves from the previous session run in the
+    # background (overlapping the inter-session delay) and are awaited before
+    # memory is read again
+    memory_tasks: list[asyncio.Task] = []
+
+    pause_file = spec_dir / HUMAN_INTERVENTION_FILE
+
+    try:
+        while True:
+            iteration += 1
+
+            # Check for human intervention (PAUSE file). Reading it directly
+            # checks for existence and gets the message in one step.
+            try:
+                pause_content = pause_file.read_text().strip()
+            except FileNotFoundError:
+                pause_content = None
+            if pause_content is not None:
+                print("\n" + "=" * 70)
+                print("  PAUSED BY HUMAN")
+                print("=" * 70)
+
+                if pause_content:
+                    print(f"\nMessage: {pause_content}")
+
+                print("\nTo resume, delete the PAUSE file:")
+                print(f"  rm {pause_file}")
+                print("\nThen run again:")
+                print(f"  python auto-claude/run.py --spec {spec_dir.name}")
+                return
+
+            # Check max iterations
+            if max_iterations and iteration > max_iterations:
+                print(f"\nReached max iterations ({max_iterations})")
+                print("To continue, run the script again without --max-iterations")
+                break
 
-            pause_content = pause_file.read_text().strip()
-            if pause_content:
-                print(f"\nMessage: {pause_content}")
+            # Load the plan once (cached until the file changes) for this iteration's
+            # subtask, phase and prompt lookups
+            plan = load_implementation_plan(spec_dir)
 
-            print("\nTo resume, delete the PAUSE file:")
-            print(f"  rm {pause_file}")
-            print("\nThen run again:")
-            print(f"  python auto-claude/run.py --spec {spec_dir.name}")
-            return
+            # Get the next subtask to work on
+            next_subtask = get_next_subtask_in_plan(plan) if plan else None
+            if next_subtask is not None:
+                subtask_id = next_subtask.get("id")
+                phase_name = next_subtask.get("phase_name")
+                subtask_desc = next_subtask.get("description")
+            else:
+                subtask_id = phase_name = subtask_desc = None
+
+            # Update status for this session (written once at the end of the batch)
+            with status_manager.batch():
+                status_manager.update_session(iteration)
+                if phase_name:
+                    current_phase = get_current_phase_in_plan(plan)
+                    if current_phase:
+                        status_manager.update_phase(
+                            current_phase.get("name", ""),
+                            current_phase.get("phase", 0),
+                            current_phase.get("total", 0),
+                        )
+                status_manager.update_subtasks(in_progress=1)
+
+            # Attempts so far for this subtask (shared by the header and prompt)
+            attempt_count = (
+                recovery_manager.get_attempt_count(subtask_id) if subtask_id else 0
+            )
 
-        # Check max iterations
-        if max_iterations and iteration > max_iterations:
-            print(f"\nReached max iterations ({max_iterations})")
-            print("To continue, run the script again without --max-iterations")
-            break
-
-        # Get the next subtask to work on
-        next_subtask = get_next_subtask(spec_dir)
-        subtask_id = next_subtask.get("id") if next_subtask else None
-        phase_name = next_subtask.get("phase_name") if next_subtask else None
-
-        # Update status for this session
-        status_manager.update_session(iteration)
-        if phase_name:
-            current_phase = get_current_phase(spec_dir)
-            if current_phase:
-                status_manager.update_phase(
-                    current_phase.get("name", ""),
-                    current_phase.get("phase", 0),
-                    current_phase.get("total", 0),
-                )
-        status_manager.update_subtasks(in_progress=1)
-
-        # Print session header
-        print_session_header(
-            session_num=iteration,
-            is_planner=first_run,
-            subtask_id=subtask_id,
-            subtask_desc=next_subtask.get("description") if next_subtask else None,
-            phase_name=phase_name,
-            attempt=recovery_manager.get_attempt_count(subtask_id) + 1
-            if subtask_id
-            else 1,
-        )
+            # Print session header
+            print_session_header(
+                session_num=iteration,
+                is_planner=first_run,
+                subtask_id=subtask_id,
+                subtask_desc=subtask_desc,
+                phase_name=phase_name,
+                attempt=attempt_count + 1,
+            )
 
-        # Capture state before session for post-processing
-        commit_before = get_latest_commit(project_dir)
-        commit_count_before = get_commit_count(project_dir)
-
-        # Get the phase-specific model and thinking level (respects task_metadata.json configuration)
-        # first_run means we're in planning phase, otherwise coding phase
-        current_phase = "planning" if first_run else "coding"
-        phase_model = get_phase_model(spec_dir, current_phase, model)
-        phase_thinking_budget = get_phase_thinking_budget(spec_dir, current_phase)
-
-        # Create client (fresh context) with phase-specific model and thinking
-        # Use appropriate agent_type for correct tool permissions and thinking budget
-        client = create_client(
-            project_dir,
-            spec_dir,
-            phase_model,
-            agent_type="planner" if first_run else "coder",
-            max_thinking_tokens=phase_thinking_budget,
-        )
+            # Capture state before session for post-processing
+            commit_before, commit_count_before = git_session.snapshot()
 
-        # Generate appropriate prompt
-        if first_run:
-            prompt = generate_planner_prompt(spec_dir, project_dir)
+            # Get the phase-specific model and thinking level (respects task_metadata.json configuration)
+            # first_run means we're in planning phase, otherwise coding phase
+            current_phase = "planning" if first_run else "coding"
+            phase_model = get_phase_model(spec_dir, current_phase, model)
+            phase_thinking_budget = get_phase_thinking_budget(spec_dir, current_phase)
 
-            # Retrieve Graphiti memory context for planning phase
-            # This gives the planner knowledge of previous patterns, gotchas, and insights
-            planner_context = await get_graphiti_context(
-                spec_dir,
+            # Create client (fresh context) with phase-specific model and thinking
+            # Use appropriate agent_type for correct tool permissions and thinking budget
+            client = create_client(
                 project_dir,
-                {
-                    "description": "Planning implementation for new feature",
-                    "id": "planner",
-                },
+                spec_dir,
+                phase_model,
+                agent_type="planner" if first_run else "coder",
+                max_thinking_tokens=phase_thinking_budget,
             )
-            if planner_context:
-                prompt += "\n\n" + planner_context
-                print_status("Graphiti memory context loaded for planner", "success")
-
-            first_run = False
-            current_log_phase = LogPhase.PLANNING
 
-            # Set session info in logger
-            if task_logger:
-                task_logger.set_session(iteration)
-        else:
-            # Switch to coding phase after planning
-            if is_planning_phase:
-                is_planning_phase = False
-                current_log_phase = LogPhase.CODING
-                emit_phase(ExecutionPhase.CODING, "Starting implementation")
-                if task_logger:
-                    task_logger.end_phase(
-                        LogPhase.PLANNING,
-                        success=True,
-                        message="Implementation plan created",
-                    )
-                    task_logger.start_phase(
-                        LogPhase.CODING, "Starting implementation..."
+            # Generate appropriate prompt
+            if first_run:
+                prompt = generate_planner_prompt(spec_dir, project_dir)
+
+                # Retrieve Graphiti memory context for planning phase
+                # This gives the planner knowledge of previous patterns, gotchas, and insights
+                await wait_for_memory_tasks(memory_tasks)
+                planner_context = await get_graphiti_context(
+                    spec_dir,
+                    project_dir,
+                    {
+                        "description": "Planning implementation for new feature",
+                        "id": "planner",
+                    },
+                )
+                if planner_context:
+                    prompt += "\n\n" + planner_context
+                    print_status(
+                        "Graphiti memory context loaded for planner", "success"
                     )
 
-            if not next_subtask:
-                print("No pending subtasks found - build may be complete!")
-                break
+                first_run = False
+                current_log_phase = LogPhase.PLANNING
 
-            # Get attempt count for recovery context
-            attempt_count = recovery_manager.get_attempt_count(subtask_id)
-            recovery_hints = (
-                recovery_manager.get_recovery_hints(subtask_id)
-                if attempt_count > 0
-                else None
-            )
+                # Set session info in logger
+                if task_logger:
+                    task_logger.set_session(iteration)
+            else:
+                # Switch to coding phase after planning
+                if is_planning_phase:
+                    is_planning_phase = False
+                    current_log_phase = LogPhase.CODING
+                    emit_phase(ExecutionPhase.CODING, "Starting implementation")
+                    if task_logger:
+                        task_logger.end_phase(
+                            LogPhase.PLANNING,
+                            success=True,
+                            message="Implementation plan created",
+                        )
+                        task_logger.start_phase(
+                            LogPhase.CODING, "Starting implementation..."
+                        )
+
+                if not next_subtask:
+                    print("No pending subtasks found - build may be complete!")
+                    break
+
+                # Recovery context from previous attempts
+                recovery_hints = (
+                    recovery_manager.get_recovery_hints(subtask_id)
+                    if attempt_count > 0
+                    else None
+                )
 
-            # Find the phase for this subtask
-            plan = load_implementation_plan(spec_dir)
-            phase = find_phase_for_subtask(plan, subtask_id) if plan else {}
-
-            # Generate focused, minimal prompt for this subtask
-            prompt = generate_subtask_prompt(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask=next_subtask,
-                phase=phase or {},
-                attempt_count=attempt_count,
-                recovery_hints=recovery_hints,
-            )
+                # Find the phase for this subtask
+                phase = find_phase_for_subtask(plan, subtask_id) if plan else {}
+
+                # Generate focused, minimal prompt for this subtask
+                prompt = generate_subtask_prompt(
+                    spec_dir=spec_dir,
+                    project_dir=project_dir,
+                    subtask=next_subtask,
+                    phase=phase or {},
+                    attempt_count=attempt_count,
+                    recovery_hints=recovery_hints,
+                )
 
-            # Load and append relevant file context
-            context = load_subtask_context(spec_dir, project_dir, next_subtask)
-            if context.get("patterns") or context.get("files_to_modify"):
-                prompt += "\n\n" + format_context_for_prompt(context)
+                # Load and append relevant file context
+                context = load_subtask_context(spec_dir, project_dir, next_subtask)
+                if context.get("patterns") or context.get("files_to_modify"):
+                    prompt += "\n\n" + format_context_for_prompt(context)
 
-            # Retrieve and append Graphiti memory context (if enabled)
-            graphiti_context = await get_graphiti_context(
-                spec_dir, project_dir, next_subtask
-            )
-            if graphiti_context:
-                prompt += "\n\n" + graphiti_context
-                print_status("Graphiti memory context loaded", "success")
-
-            # Show what we're working on
-            print(f"Working on: {highlight(subtask_id)}")
-            print(f"Description: {next_subtask.get('description', 'No description')}")
-            if attempt_count > 0:
-                print_status(f"Previous attempts: {attempt_count}", "warning")
-            print()
+                # Retrieve and append Graphiti memory context (if enabled)
+                await wait_for_memory_tasks(memory_tasks)
+                graphiti_context = await get_graphiti_context(
+                    spec_dir, project_dir, next_subtask
+                )
+                if graphiti_context:
+                    prompt += "\n\n" + graphiti_context
+                    print_status("Graphiti memory context loaded", "success")
 
-        # Set subtask info in logger
-        if task_logger and subtask_id:
-            task_logger.set_subtask(subtask_id)
-            task_logger.set_session(iteration)
+                # Show what we're working on
+                print(f"Working on: {highlight(subtask_id)}")
+                print(f"Description: {subtask_desc or 'No description'}")
+                if attempt_count > 0:
+                    print_status(f"Previous attempts: {attempt_count}", "warning")
+                print()
 
-        # Run session with async context manager
-        async with client:
-            status, response = await run_agent_session(
-                client, prompt, spec_dir, verbose, phase=current_log_phase
-            )
+            # Set subtask info in logger
+            if task_logger and subtask_id:
+                task_logger.set_subtask(subtask_id)
+                task_logger.set_session(iteration)
 
-        # === POST-SESSION PROCESSING (100% reliable) ===
-        if subtask_id and not first_run:
-            linear_is_enabled = (
-                linear_task is not None and linear_task.task_id is not None
-            )
-            success = await post_session_processing(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask_id=subtask_id,
-                session_num=iteration,
-                commit_before=commit_before,
-                commit_count_before=commit_count_before,
-                recovery_manager=recovery_manager,
-                linear_enabled=linear_is_enabled,
-                status_manager=status_manager,
-                source_spec_dir=source_spec_dir,
-            )
+            # Run session with async context manager
+            async with client:
+                status, response = await run_agent_session(
+                    client, prompt, spec_dir, verbose, phase=current_log_phase
+                )
 
-            # Check for stuck subtasks
-            attempt_count = recovery_manager.get_attempt_count(subtask_id)
-            if not success and attempt_count >= 3:
-                recovery_manager.mark_subtask_stuck(
-                    subtask_id, f"Failed after {attempt_count} attempts"
+            # === POST-SESSION PROCESSING (100% reliable) ===
+            if subtask_id and not first_run:
+                linear_is_enabled = (
+                    linear_task is not None and linear_task.task_id is not None
                 )
-                print()
-                print_status(
-                    f"Subtask {subtask_id} marked as STUCK after {attempt_count} attempts",
-                    "error",
+                success, attempt_count = await post_session_processing(
+                    spec_dir=spec_dir,
+                    project_dir=project_dir,
+                    subtask_id=subtask_id,
+                    session_num=iteration,
+                    commit_before=commit_before,
+                    commit_count_before=commit_count_before,
+                    recovery_manager=recovery_manager,
+                    linear_enabled=linear_is_enabled,
+                    status_manager=status_manager,
+                    source_spec_dir=source_spec_dir,
+                    memory_tasks=memory_tasks,
+                    git_session=git_session,
                 )
-                print(muted("Consider: manual intervention or skipping this subtask"))
-
-                # Record stuck subtask in Linear (if enabled)
-                if linear_is_enabled:
-                    await linear_task_stuck(
-                        spec_dir=spec_dir,
-                        subtask_id=subtask_id,
-                        attempt_count=attempt_count,
+
+                # Check for stuck subtasks
+                if not success and attempt_count >= 3:
+                    recovery_manager.mark_subtask_stuck(
+                        subtask_id, f"Failed after {attempt_count} attempts"
+                    )
+                    print()
+                    print_status(
+                        f"Subtask {subtask_id} marked as STUCK after {attempt_count} attempts",
+                        "error",
+                    )
+                    print(
+                        muted("Consider: manual intervention or skipping this subtask")
                     )
-                    print_status("Linear notified of stuck subtask", "info")
-        elif is_planning_phase and source_spec_dir:
-            # After planning phase, sync the newly created implementation plan back to source
-            if sync_plan_to_source(spec_dir, source_spec_dir):
-                print_status("Implementation plan synced to main project", "success")
-
-        # Handle session status
-        if status == "complete":
-            # Don't emit COMPLETE here - subtasks are done but QA hasn't run yet
-            # QA loop will emit COMPLETE after actual approval
-            print_build_complete_banner(spec_dir)
-            status_manager.update(state=BuildState.COMPLETE)
 
-            if task_logger:
-                task_logger.end_phase(
-                    LogPhase.CODING,
-                    success=True,
-                    message="All subtasks completed successfully",
-                )
+                    # Record stuck subtask in Linear (if enabled)
+                    if linear_is_enabled:
+                        await linear_task_stuck(
+                            spec_dir=spec_dir,
+                            subtask_id=subtask_id,
+                            attempt_count=attempt_count,
+                        )
+                        print_status("Linear notified of stuck subtask", "info")
+            elif is_planning_phase and source_spec_dir:
+                # After planning phase, sync the newly created implementation plan back to source
+                if sync_plan_to_source(spec_dir, source_spec_dir):
+                    print_status(
+                        "Implementation plan synced to main project", "success"
+                    )
 
-            if linear_task and linear_task.task_id:
-                await linear_build_complete(spec_dir)
-                print_status("Linear notified: build complete, ready for QA", "success")
+            # Handle session status
+            if status == "complete":
+                # Don't emit COMPLETE here - subtasks are done but QA hasn't run yet
+                # QA loop will emit COMPLETE after actual approval
+                print_build_complete_banner(spec_dir)
+                status_manager.update(state=BuildState.COMPLETE)
 
-            break
+                if task_logger:
+                    task_logger.end_phase(
+                        LogPhase.CODING,
+                        success=True,
+                        message="All subtasks completed successfully",
+                    )
 
-        elif status == "continue":
-            print(
-                muted(
-                    f"\nAgent will auto-continue in {AUTO_CONTINUE_DELAY_SECONDS}s..."
-                )
-            )
-            print_progress_summary(spec_dir)
+                if linear_task and linear_task.task_id:
+                    await linear_build_complete(spec_dir)
+                    print_status(
+                        "Linear notified: build complete, ready for QA", "success"
+                    )
 
-            # Update state back to building
-            status_manager.update(state=BuildState.BUILDING)
+                break
 
-            # Show next subtask info
-            next_subtask = get_next_subtask(spec_dir)
-            if next_subtask:
-                subtask_id = next_subtask.get("id")
+            elif status == "continue":
                 print(
-                    f"\nNext: {highlight(subtask_id)} - {next_subtask.get('description')}"
-                )
-
-                attempt_count = recovery_manager.get_attempt_count(subtask_id)
-                if attempt_count > 0:
-                    print_status(
-                        f"WARNING: {attempt_count} previous attempt(s)", "warning"
+                    muted(
+                        f"\nAgent will auto-continue in {AUTO_CONTINUE_DELAY_SECONDS}s..."
                     )
+                )
+                plan = load_implementation_plan(spec_dir)
+                progress_counts = print_progress_summary(
+                    spec_dir, plan=plan, previous=progress_counts
+                )
 
-            await asyncio.sleep(AUTO_CONTINUE_DELAY_SECONDS)
+                # Update state back to building
+                status_manager.update(state=BuildState.BUILDING)
 
-        elif status == "error":
-            emit_phase(ExecutionPhase.FAILED, "Session encountered an error")
-            print_status("Session encountered an error", "error")
-            print(muted("Will retry with a fresh session..."))
-            status_manager.update(state=BuildState.ERROR)
-            await asyncio.sleep(AUTO_CONTINUE_DELAY_SECONDS)
+                # Show next subtask info
+                next_subtask = get_next_subtask_in_plan(plan) if plan else None
+                if next_subtask:
+                    subtask_id = next_subtask.get("id")
+                    print(
+                        f"\nNext: {highlight(subtask_id)} - {next_subtask.get('description')}"
+                    )
 
-        # Small delay between sessions
-        if max_iterations is None or iteration < max_iterations:
-            print("\nPreparing next session...\n")
-            await asyncio.sleep(1)
+                    attempt_count = recovery_manager.get_attempt_count(subtask_id)
+                    if attempt_count > 0:
+                        print_status(
+                            f"WARNING: {attempt_count} previous attempt(s)", "warning"
+                        )
+
+                await asyncio.sleep(AUTO_CONTINUE_DELAY_SECONDS)
+
+            elif status == "error":
+                emit_phase(ExecutionPhase.FAILED, "Session encountered an error")
+                print_status("Session encountered an error", "error")
+                print(muted("Will retry with a fresh session..."))
+                status_manager.update(state=BuildState.ERROR)
+                await asyncio.sleep(AUTO_CONTINUE_DELAY_SECONDS)
+
+            # Small delay between sessions
+            if max_iterations is None or iteration < max_iterations:
+                print("\nPreparing next session...\n")
+                await asyncio.sleep(1)
+    except BaseException:
+        # Interrupted or failed mid-build: stop in-flight memory updates
+        # instead of waiting for their LLM calls
+        for task in memory_tasks:
+            task.cancel()
+        raise
+    finally:
+        # Let any pending memory updates finish before summarizing, and stop
+        # the git helper process on every exit path
+        await wait_for_memory_tasks(memory_tasks)
+        git_session.close()
 
     # Final summary
     content = [
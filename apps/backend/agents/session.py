@@ -6,7 +6,9 @@ Handles running agent sessions and post-session processing including
 memory updates, recovery tracking, and Linear integration.
 """
 
+import asyncio
 import logging
+import sys
 from pathlib import Path
 
 from claude_agent_sdk import ClaudeSDKClient
@@ -17,8 +19,8 @@ from linear_updater import (
     linear_subtask_failed,
 )
 from progress import (
-    count_subtasks_detailed,
-    is_build_complete,
+    count_subtasks_in_plan,
+    is_build_complete_in_plan,
 )
 from recovery import RecoveryManager
 from security.tool_input_validator import get_safe_tool_input
@@ -36,15 +38,122 @@ from ui import (
 
 from .memory_manager import save_session_memory
 from .utils import (
+    GitSession,
     find_subtask_in_plan,
-    get_commit_count,
-    get_latest_commit,
+    get_git_snapshot,
     load_implementation_plan,
     sync_plan_to_source,
 )
 
 logger = logging.getLogger(__name__)
 
+# Tools whose successful results are kept as expandable detail in the task log
+_DETAIL_TOOLS = frozenset({"Read", "Grep", "Bash", "Edit", "Write"})
+
+
+async def update_session_memory(
+    spec_dir: Path,
+    project_dir: Path,
+    subtask_id: str,
+    session_num: int,
+    commit_before: str | None,
+    commit_after: str | None,
+    success: bool,
+    recovery_manager: RecoveryManager,
+) -> None:
+    """
+    Extract insights from a session and save them to session memory.
+
+    Args:
+        spec_dir: Spec directory containing memory/
+        project_dir: Project root for git operations
+        subtask_id: The subtask that was being worked on
+        session_num: Current session number
+        commit_before: Git commit hash before session
+        commit_after: Git commit hash after session
+        success: Whether the subtask was completed
+        recovery_manager: Recovery manager instance
+    """
+    # Extract rich insights from session (LLM-powered analysis)
+    try:
+        extracted_insights = await extract_session_insights(
+            spec_dir=spec_dir,
+            project_dir=project_dir,
+            subtask_id=subtask_id,
+            session_num=session_num,
+            commit_before=commit_before,
+            commit_after=commit_after,
+            success=success,
+            recovery_manager=recovery_manager,
+        )
+        if success:
+            insight_count = len(extracted_insights.get("file_insights", []))
+            pattern_count = len(extracted_insights.get("patterns_discovered", []))
+            if insight_count > 0 or pattern_count > 0:
+                print_status(
+                    f"Extracted {insight_count} file insights, {pattern_count} patterns",
+                    "success",
+                )
+    except Exception as e:
+        if success:
+            logger.warning(f"Insight extraction failed: {e}")
+        else:
+            logger.debug(f"Insight extraction failed for unsuccessful session: {e}")
+        extracted_insights = None
+
+    # Save session memory (Graphiti=primary, file-based=fallback)
+    try:
+        save_success, storage_type = await save_session_memory(
+            spec_dir=spec_dir,
+            project_dir=project_dir,
+            subtask_id=subtask_id,
+            session_num=session_num,
+            success=success,
+            subtasks_completed=[subtask_id] if success else [],
+            discoveries=extracted_insights,
+        )
+        if not success:
+            return
+        if save_success:
+            if storage_type == "graphiti":
+                print_status("Session saved to Graphiti memory", "success")
+            else:
+                print_status("Session saved to file-based memory (fallback)", "info")
+        else:
+            print_status("Failed to save session memory", "warning")
+    except Exception as e:
+        if success:
+            logger.warning(f"Error saving session memory: {e}")
+            print_status("Memory save failed", "warning")
+        else:
+            logger.debug(f"Failed to save unsuccessful session memory: {e}")
+
+
+async def _dispatch_memory_update(
+    memory_tasks: list[asyncio.Task] | None, **kwargs
+) -> None:
+    """Run update_session_memory now, or in the background if given a task list."""
+    if memory_tasks is None:
+        await update_session_memory(**kwargs)
+    else:
+        memory_tasks.append(asyncio.create_task(update_session_memory(**kwargs)))
+
+
+async def wait_for_memory_tasks(memory_tasks: list[asyncio.Task]) -> None:
+    """
+    Wait for background memory updates started by post_session_processing.
+
+    Call this before reading memory again (e.g. get_graphiti_context) so the
+    next session sees the insights from the previous one.
+    """
+    if not memory_tasks:
+        return
+    results = await asyncio.gather(*memory_tasks, return_exceptions=True)
+    memory_tasks.clear()
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning(f"Background session memory update failed: {result}")
+
 
 async def post_session_processing(
     spec_dir: Path,
@@ -57,7 +166,9 @@ async def post_session_processing(
     linear_enabled: bool = False,
     status_manager: StatusManager | None = None,
     source_spec_dir: Path | None = None,
-) -> bool:
+    memory_tasks: list[asyncio.Task] | None = None,
+    git_session: GitSession | None = None,
+) -> tuple[bool, int]:
     """
     Process session results and update memory automatically.
 
@@ -74,9 +185,14 @@ async def post_session_processing(
         linear_enabled: Whether Linear integration is enabled
         status_manager: Optional status manager for ccstatusline
         source_spec_dir: Original spec directory (for syncing back from worktree)
+        memory_tasks: If given, insight extraction and memory saving run as a
+            background task appended to this list instead of being awaited.
+            Callers must await them with wait_for_memory_tasks().
+        git_session: Optional long-lived git helper for the commit snapshot
 
     Returns:
-        True if subtask was completed successfully
+        (True if subtask was completed successfully, number of attempts at
+        the subtask including this session's)
     """
     print()
     print(muted("--- Post-Session Processing ---"))
@@ -89,18 +205,22 @@ async def post_session_processing(
     plan = load_implementation_plan(spec_dir)
     if not plan:
         print("  Warning: Could not load implementation plan")
-        return False
+        return False, recovery_manager.get_attempt_count(subtask_id)
 
     subtask = find_subtask_in_plan(plan, subtask_id)
     if not subtask:
         print(f"  Warning: Subtask {subtask_id} not found in plan")
-        return False
+        return False, recovery_manager.get_attempt_count(subtask_id)
 
     subtask_status = subtask.get("status", "pending")
 
     # Check for new commits
-    commit_after = get_latest_commit(project_dir)
-    commit_count_after = get_commit_count(project_dir)
+    if git_session:
+        commit_after, commit_count_after = git_session.snapshot()
+    else:
+        commit_after, commit_count_after = get_git_snapshot(
+            project_dir, previous=(commit_before, commit_count_before)
+        )
     new_commits = commit_count_after - commit_count_before
 
     print_key_value("Subtask status", subtask_status)
@@ -110,9 +230,11 @@ async def post_session_processing(
         # Success! Record the attempt and good commit
         print_status(f"Subtask {subtask_id} completed successfully", "success")
 
+        # Count once from the plan loaded above (status file + Linear)
+        subtasks = count_subtasks_in_plan(plan)
+
         # Update status file
         if status_manager:
-            subtasks = count_subtasks_detailed(spec_dir)
             status_manager.update_subtasks(
                 completed=subtasks["completed"],
                 total=subtasks["total"],
@@ -120,7 +242,7 @@ async def post_session_processing(
             )
 
         # Record successful attempt
-        recovery_manager.record_attempt(
+        attempt_count = recovery_manager.record_attempt(
             subtask_id=subtask_id,
             session=session_num,
             success=True,
@@ -134,70 +256,34 @@ async def post_session_processing(
 
         # Record Linear session result (if enabled)
         if linear_enabled:
-            # Get progress counts for the comment
-            subtasks_detail = count_subtasks_detailed(spec_dir)
             await linear_subtask_completed(
                 spec_dir=spec_dir,
                 subtask_id=subtask_id,
-                completed_count=subtasks_detail["completed"],
-                total_count=subtasks_detail["total"],
+                completed_count=subtasks["completed"],
+                total_count=subtasks["total"],
             )
             print_status("Linear progress recorded", "success")
 
-        # Extract rich insights from session (LLM-powered analysis)
-        try:
-            extracted_insights = await extract_session_insights(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask_id=subtask_id,
-                session_num=session_num,
-                commit_before=commit_before,
-                commit_after=commit_after,
-                success=True,
-                recovery_manager=recovery_manager,
-            )
-            insight_count = len(extracted_insights.get("file_insights", []))
-            pattern_count = len(extracted_insights.get("patterns_discovered", []))
-            if insight_count > 0 or pattern_count > 0:
-                print_status(
-                    f"Extracted {insight_count} file insights, {pattern_count} patterns",
-                    "success",
-                )
-        except Exception as e:
-            logger.warning(f"Insight extraction failed: {e}")
-            extracted_insights = None
-
-        # Save session memory (Graphiti=primary, file-based=fallback)
-        try:
-            save_success, storage_type = await save_session_memory(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask_id=subtask_id,
-                session_num=session_num,
-                success=True,
-                subtasks_completed=[subtask_id],
-                discoveries=extracted_insights,
-            )
-            if save_success:
-                if storage_type == "graphiti":
-                    print_status("Session saved to Graphiti memory", "success")
-                else:
-                    print_status(
-                        "Session saved to file-based memory (fallback)", "info"
-                    )
-            else:
-                print_status("Failed to save session memory", "warning")
-        except Exception as e:
-            logger.warning(f"Error saving session memory: {e}")
-            print_status("Memory save failed", "warning")
+        # Extract insights and save session memory (LLM-powered analysis)
+        await _dispatch_memory_update(
+            memory_tasks,
+            spec_dir=spec_dir,
+            project_dir=project_dir,
+            subtask_id=subtask_id,
+            session_num=session_num,
+            commit_before=commit_before,
+            commit_after=commit_after,
+            success=True,
+            recovery_manager=recovery_manager,
+        )
 
-        return True
+        return True, attempt_count
 
     elif subtask_status == "in_progress":
         # Session ended without completion
         print_status(f"Subtask {subtask_id} still in progress", "warning")
 
-        recovery_manager.record_attempt(
+        attempt_count = recovery_manager.record_attempt(
             subtask_id=subtask_id,
             session=session_num,
             success=False,
@@ -214,7 +300,6 @@ async def post_session_processing(
 
         # Record Linear session result (if enabled)
         if linear_enabled:
-            attempt_count = recovery_manager.get_attempt_count(subtask_id)
             await linear_subtask_failed(
                 spec_dir=spec_dir,
                 subtask_id=subtask_id,
@@ -223,36 +308,19 @@ async def post_session_processing(
             )
 
         # Extract insights even from failed sessions (valuable for future attempts)
-        try:
-            extracted_insights = await extract_session_insights(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask_id=subtask_id,
-                session_num=session_num,
-                commit_before=commit_before,
-                commit_after=commit_after,
-                success=False,
-                recovery_manager=recovery_manager,
-            )
-        except Exception as e:
-            logger.debug(f"Insight extraction failed for incomplete session: {e}")
-            extracted_insights = None
-
-        # Save failed session memory (to track what didn't work)
-        try:
-            await save_session_memory(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask_id=subtask_id,
-                session_num=session_num,
-                success=False,
-                subtasks_completed=[],
-                discoveries=extracted_insights,
-            )
-        except Exception as e:
-            logger.debug(f"Failed to save incomplete session memory: {e}")
+        await _dispatch_memory_update(
+            memory_tasks,
+            spec_dir=spec_dir,
+            project_dir=project_dir,
+            subtask_id=subtask_id,
+            session_num=session_num,
+            commit_before=commit_before,
+            commit_after=commit_after,
+            success=False,
+            recovery_manager=recovery_manager,
+        )
 
-        return False
+        return False, attempt_count
 
     else:
         # Subtask still pending or failed
@@ -260,7 +328,7 @@ async def post_session_processing(
             f"Subtask {subtask_id} not completed (status: {subtask_status})", "error"
         )
 
-        recovery_manager.record_attempt(
+        attempt_count = recovery_manager.record_attempt(
             subtask_id=subtask_id,
             session=session_num,
             success=False,
@@ -270,7 +338,6 @@ async def post_session_processing(
 
         # Record Linear session result (if enabled)
         if linear_enabled:
-            attempt_count = recovery_manager.get_attempt_count(subtask_id)
             await linear_subtask_failed(
                 spec_dir=spec_dir,
                 subtask_id=subtask_id,
@@ -279,36 +346,47 @@ async def post_session_processing(
             )
 
         # Extract insights even from completely failed sessions
-        try:
-            extracted_insights = await extract_session_insights(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask_id=subtask_id,
-                session_num=session_num,
-                commit_before=commit_before,
-                commit_after=commit_after,
-                success=False,
-                recovery_manager=recovery_manager,
-            )
-        except Exception as e:
-            logger.debug(f"Insight extraction failed for failed session: {e}")
-            extracted_insights = None
+        await _dispatch_memory_update(
+            memory_tasks,
+            spec_dir=spec_dir,
+            project_dir=project_dir,
+            subtask_id=subtask_id,
+            session_num=session_num,
+            commit_before=commit_before,
+            commit_after=commit_after,
+            success=False,
+            recovery_manager=recovery_manager,
+        )
 
-        # Save failed session memory (to track what didn't work)
-        try:
-            await save_session_memory(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask_id=subtask_id,
-                session_num=session_num,
-                success=False,
-                subtasks_completed=[],
-                discoveries=extracted_insights,
-            )
-        except Exception as e:
-            logger.debug(f"Failed to save failed session memory: {e}")
+        return False, attempt_count
 
-        return False
+
+class _ConsoleTextBuffer:
+    """
+    Coalesce streamed assistant text into fewer stdout writes.
+
+    Text is written at message boundaries (callers flush after each message
+    and before printing anything else, so output stays in order) or once the
+    buffer reaches ``flush_chars``.
+    """
+
+    def __init__(self, flush_chars: int = 4096):
+        self.flush_chars = flush_chars
+        self._parts: list[str] = []
+        self._size = 0
+
+    def write(self, text: str) -> None:
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.flush_chars:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._parts:
+            sys.stdout.write("".join(self._parts))
+            sys.stdout.flush()
+            self._parts.clear()
+            self._size = 0
 
 
 async def run_agent_session(
@@ -350,6 +428,7 @@ async def run_agent_session(
     current_tool = None
     message_count = 0
     tool_count = 0
+    console_text = _ConsoleTextBuffer()
 
     try:
         # Send the query
@@ -358,7 +437,7 @@ async def run_agent_session(
         debug_success("session", "Query sent successfully")
 
         # Collect response text and show tool use
-        response_text = ""
+        response_parts: list[str] = []
         debug("session", "Starting to receive response stream...")
         async for msg in client.receive_response():
             msg_type = type(msg).__name__
@@ -372,155 +451,160 @@ async def run_agent_session(
             # Handle AssistantMessage (text and tool use)
             if msg_type == "AssistantMessage" and hasattr(msg, "content"):
                 for block in msg.content:
-                    block_type = type(block).__name__
-
-                    if block_type == "TextBlock" and hasattr(block, "text"):
-                        response_text += block.text
-                        print(block.text, end="", flush=True)
-                        # Log text to task logger (persist without double-printing)
-                        if task_logger and block.text.strip():
-                            task_logger.log(
-                                block.text,
-                                LogEntryType.TEXT,
-                                phase,
-                                print_to_console=False,
-                            )
-                    elif block_type == "ToolUseBlock" and hasattr(block, "name"):
-                        tool_name = block.name
-                        tool_input_display = None
-                        tool_count += 1
-
-                        # Safely extract tool input (handles None, non-dict, etc.)
-                        inp = get_safe_tool_input(block)
-
-                        # Extract meaningful tool input for display
-                        if inp:
-                            if "pattern" in inp:
-                                tool_input_display = f"pattern: {inp['pattern']}"
-                            elif "file_path" in inp:
-                                fp = inp["file_path"]
-                                if len(fp) > 50:
-                                    fp = "..." + fp[-47:]
-                                tool_input_display = fp
-                            elif "command" in inp:
-                                cmd = inp["command"]
-                                if len(cmd) > 50:
-                                    cmd = cmd[:47] + "..."
-                                tool_input_display = cmd
-                            elif "path" in inp:
-                                tool_input_display = inp["path"]
-
-                        debug(
-                            "session",
-                            f"Tool call #{tool_count}: {tool_name}",
-                            tool_input=tool_input_display,
-                            full_input=str(inp)[:500] if inp else None,
-                        )
-
-                        # Log tool start (handles printing too)
-                        if task_logger:
-                            task_logger.tool_start(
-                                tool_name,
-                                tool_input_display,
-                                phase,
-                                print_to_console=True,
+                    match type(block).__name__:
+                        case "TextBlock":
+                            text = getattr(block, "text", None)
+                            if text is None:
+                                continue
+                            response_parts.append(text)
+                            console_text.write(text)
+                            # Log text to task logger (persist without double-printing)
+                            if task_logger and text.strip():
+                                task_logger.log(
+                                    text,
+                                    LogEntryType.TEXT,
+                                    phase,
+                                    print_to_console=False,
+                                )
+                        case "ToolUseBlock":
+                            tool_name = getattr(block, "name", None)
+                            if tool_name is None:
+                                continue
+                            console_text.flush()
+                            tool_input_display = None
+                            tool_count += 1
+
+                            # Safely extract tool input (handles None, non-dict, etc.)
+                            inp = get_safe_tool_input(block)
+
+                            # Extract meaningful tool input for display
+                            if inp:
+                                if "pattern" in inp:
+                                    tool_input_display = f"pattern: {inp['pattern']}"
+                                elif "file_path" in inp:
+                                    fp = inp["file_path"]
+                                    if len(fp) > 50:
+                                        fp = "..." + fp[-47:]
+                                    tool_input_display = fp
+                                elif "command" in inp:
+                                    cmd = inp["command"]
+                                    if len(cmd) > 50:
+                                        cmd = cmd[:47] + "..."
+                                    tool_input_display = cmd
+                                elif "path" in inp:
+                                    tool_input_display = inp["path"]
+
+                            debug(
+                                "session",
+                                f"Tool call #{tool_count}: {tool_name}",
+                                tool_input=tool_input_display,
+                                full_input=str(inp)[:500] if inp else None,
                             )
-                        else:
-                            print(f"\n[Tool: {tool_name}]", flush=True)
 
-                        if verbose and hasattr(block, "input"):
-                            input_str = str(block.input)
-                            if len(input_str) > 300:
-                                print(f"   Input: {input_str[:300]}...", flush=True)
+                            # Log tool start (handles printing too)
+                            if task_logger:
+                                task_logger.tool_start(
+                                    tool_name,
+                                    tool_input_display,
+                                    phase,
+                                    print_to_console=True,
+                                )
                             else:
-                                print(f"   Input: {input_str}", flush=True)
-                        current_tool = tool_name
+                                print(f"\n[Tool: {tool_name}]", flush=True)
+
+                            if verbose and hasattr(block, "input"):
+                                input_str = str(block.input)
+                                if len(input_str) > 300:
+                                    print(f"   Input: {input_str[:300]}...", flush=True)
+                                else:
+                                    print(f"   Input: {input_str}", flush=True)
+                            current_tool = tool_name
+
+                # Message boundary: show any text from this message
+                console_text.flush()
 
             # Handle UserMessage (tool results)
             elif msg_type == "UserMessage" and hasattr(msg, "content"):
+                console_text.flush()
                 for block in msg.content:
-                    block_type = type(block).__name__
-
-                    if block_type == "ToolResultBlock":
-                        result_content = getattr(block, "content", "")
-                        is_error = getattr(block, "is_error", False)
-
-                        # Check if command was blocked by security hook
-                        if "blocked" in str(result_content).lower():
-                            debug_error(
-                                "session",
-                                f"Tool BLOCKED: {current_tool}",
-                                result=str(result_content)[:300],
+                    if type(block).__name__ != "ToolResultBlock":
+                        continue
+                    # Stringify once; tool results (file reads, command output)
+                    # can be large and are checked, printed and logged below
+                    result_str = str(getattr(block, "content", ""))
+                    is_error = getattr(block, "is_error", False)
+
+                    # Check if command was blocked by security hook
+                    if "blocked" in result_str.lower():
+                        debug_error(
+                            "session",
+                            f"Tool BLOCKED: {current_tool}",
+                            result=result_str[:300],
+                        )
+                        print(f"   [BLOCKED] {result_str}", flush=True)
+                        if task_logger and current_tool:
+                            task_logger.tool_end(
+                                current_tool,
+                                success=False,
+                                result="BLOCKED",
+                                detail=result_str,
+                                phase=phase,
                             )
-                            print(f"   [BLOCKED] {result_content}", flush=True)
-                            if task_logger and current_tool:
-                                task_logger.tool_end(
-                                    current_tool,
-                                    success=False,
-                                    result="BLOCKED",
-                                    detail=str(result_content),
-                                    phase=phase,
-                                )
-                        elif is_error:
-                            # Show errors (truncated)
-                            error_str = str(result_content)[:500]
-                            debug_error(
-                                "session",
-                                f"Tool error: {current_tool}",
-                                error=error_str[:200],
+                    elif is_error:
+                        # Show errors (truncated)
+                        error_str = result_str[:500]
+                        debug_error(
+                            "session",
+                            f"Tool error: {current_tool}",
+                            error=error_str[:200],
+                        )
+                        print(f"   [Error] {error_str}", flush=True)
+                        if task_logger and current_tool:
+                            # Store full error in detail for expandable view
+                            task_logger.tool_end(
+                                current_tool,
+                                success=False,
+                                result=error_str[:100],
+                                detail=result_str,
+                                phase=phase,
                             )
-                            print(f"   [Error] {error_str}", flush=True)
-                            if task_logger and current_tool:
-                                # Store full error in detail for expandable view
-                                task_logger.tool_end(
-                                    current_tool,
-                                    success=False,
-                                    result=error_str[:100],
-                                    detail=str(result_content),
-                                    phase=phase,
-                                )
+                    else:
+                        # Tool succeeded
+                        debug_detailed(
+                            "session",
+                            f"Tool success: {current_tool}",
+                            result_length=len(result_str),
+                        )
+                        if verbose:
+                            print(f"   [Done] {result_str[:200]}", flush=True)
                         else:
-                            # Tool succeeded
-                            debug_detailed(
-                                "session",
-                                f"Tool success: {current_tool}",
-                                result_length=len(str(result_content)),
+                            print("   [Done]", flush=True)
+                        if task_logger and current_tool:
+                            # Store full result in detail for expandable view (only for certain tools)
+                            # Skip storing for very large outputs like Glob results
+                            detail_content = None
+                            # Only store if not too large (50KB max; detail truncation happens in logger)
+                            if (
+                                current_tool in _DETAIL_TOOLS
+                                and len(result_str) < 50000
+                            ):
+                                detail_content = result_str
+                            task_logger.tool_end(
+                                current_tool,
+                                success=True,
+                                detail=detail_content,
+                                phase=phase,
                             )
-                            if verbose:
-                                result_str = str(result_content)[:200]
-                                print(f"   [Done] {result_str}", flush=True)
-                            else:
-                                print("   [Done]", flush=True)
-                            if task_logger and current_tool:
-                                # Store full result in detail for expandable view (only for certain tools)
-                                # Skip storing for very large outputs like Glob results
-                                detail_content = None
-                                if current_tool in (
-                                    "Read",
-                                    "Grep",
-                                    "Bash",
-                                    "Edit",
-                                    "Write",
-                                ):
-                                    result_str = str(result_content)
-                                    # Only store if not too large (detail truncation happens in logger)
-                                    if (
-                                        len(result_str) < 50000
-                                    ):  # 50KB max before truncation
-                                        detail_content = result_str
-                                task_logger.tool_end(
-                                    current_tool,
-                                    success=True,
-                                    detail=detail_content,
-                                    phase=phase,
-                                )
 
-                        current_tool = None
+                    current_tool = None
 
+        console_text.flush()
         print("\n" + "-" * 70 + "\n")
+        response_text = "".join(response_parts)
 
-        # Check if build is complete
-        if is_build_complete(spec_dir):
+        # Check if build is complete (post-processing reuses this cached parse)
+        plan = load_implementation_plan(spec_dir)
+        if plan and is_build_complete_in_plan(plan):
             debug_success(
                 "session",
                 "Session completed - build is complete",
@@ -540,6 +624,7 @@ async def run_agent_session(
         return "continue", response_text
 
     except Exception as e:
+        console_text.flush()
         debug_error(
             "session",
             f"Session error: {e}",
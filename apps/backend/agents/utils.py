@@ -5,73 +5,288 @@ Utility Functions for Agent System
 Helper functions for git operations, plan management, and file syncing.
 """
 
-import json
 import logging
 import shutil
 import subprocess
+import weakref
 from pathlib import Path
 
+# The cached plan loader lives in core; re-exported here for the agent modules
+from core.plan_io import (  # noqa: F401
+    invalidate_plan_cache,
+    is_cached_plan,
+    load_implementation_plan,
+)
+
 logger = logging.getLogger(__name__)
 
+# Subtask index for the most recently searched cached plan: (plan, index)
+_SUBTASK_INDEX: tuple[dict, dict[str, tuple[dict, dict]]] | None = None
+
+
+def _git_output(project_dir: Path, *args: str) -> str | None:
+    """
+    Run a short git query and return its stripped stdout, or None on failure.
+
+    Only stdout is piped (stderr goes to DEVNULL) and the output is decoded
+    directly, keeping per-call overhead low for one-line queries.
+    """
+    result = subprocess.run(
+        ["git", *args],
+        cwd=project_dir,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.decode("utf-8", "replace").strip()
+
 
 def get_latest_commit(project_dir: Path) -> str | None:
     """Get the hash of the latest git commit."""
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return result.stdout.strip()
-    except subprocess.CalledProcessError:
-        return None
+    return _git_output(project_dir, "rev-parse", "HEAD") or None
 
 
 def get_commit_count(project_dir: Path) -> int:
     """Get the total number of commits."""
     try:
-        result = subprocess.run(
-            ["git", "rev-list", "--count", "HEAD"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return int(result.stdout.strip())
-    except (subprocess.CalledProcessError, ValueError):
+        return int(_git_output(project_dir, "rev-list", "--count", "HEAD") or 0)
+    except ValueError:
         return 0
 
 
-def load_implementation_plan(spec_dir: Path) -> dict | None:
-    """Load the implementation plan JSON."""
-    plan_file = spec_dir / "implementation_plan.json"
-    if not plan_file.exists():
-        return None
+def _resolve_head_from_files(project_dir: Path) -> str | None:
+    """
+    Resolve HEAD to a commit hash by reading git's files directly.
+
+    Handles linked worktrees (``.git`` file + ``commondir``), symbolic and
+    detached HEAD, loose refs and packed-refs. Returns None when anything is
+    unexpected so callers can fall back to ``git rev-parse``.
+    """
     try:
-        with open(plan_file) as f:
-            return json.load(f)
-    except (OSError, json.JSONDecodeError):
+        git_path = project_dir / ".git"
+        if git_path.is_file():
+            gitdir_line = git_path.read_text().strip()
+            if not gitdir_line.startswith("gitdir:"):
+                return None
+            git_dir = (project_dir / gitdir_line[len("gitdir:") :].strip()).resolve()
+        elif git_path.is_dir():
+            git_dir = git_path
+        else:
+            return None
+
+        common_dir = git_dir
+        commondir_file = git_dir / "commondir"
+        if commondir_file.exists():
+            common_dir = (git_dir / commondir_file.read_text().strip()).resolve()
+
+        head = (git_dir / "HEAD").read_text().strip()
+        if not head.startswith("ref:"):
+            return head or None  # Detached HEAD
+
+        ref = head[len("ref:") :].strip()
+        for ref_dir in (git_dir, common_dir):
+            ref_file = ref_dir / ref
+            if ref_file.is_file():
+                return ref_file.read_text().strip() or None
+
+        packed_refs = common_dir / "packed-refs"
+        if packed_refs.exists():
+            for line in packed_refs.read_text().splitlines():
+                if line.endswith(" " + ref) and not line.startswith(("#", "^")):
+                    return line.split(" ", 1)[0]
+    except OSError:
+        pass
+    return None
+
+
+def get_git_snapshot(
+    project_dir: Path, previous: tuple[str | None, int] | None = None
+) -> tuple[str | None, int]:
+    """
+    Get the latest commit hash and total commit count together.
+
+    The hash is read from git's files where possible, so only one git process
+    (``rev-list --count``) is spawned instead of two.
+
+    Args:
+        project_dir: Project root directory
+        previous: Optional earlier (commit, count) snapshot; if HEAD still
+            points at that commit, its count is reused without running git
+
+    Returns:
+        (commit hash or None, commit count)
+    """
+    commit = _resolve_head_from_files(project_dir)
+    if previous is not None and commit is not None and commit == previous[0]:
+        return previous
+    count = get_commit_count(project_dir)
+    if commit is None and count:
+        commit = get_latest_commit(project_dir)
+    return commit, count
+
+
+class GitSession:
+    """
+    Long-lived git helper for repeated HEAD and commit-count queries.
+
+    Keeps one ``git cat-file --batch-check`` process per project to resolve
+    HEAD (git re-reads refs on every lookup), and updates the commit count
+    incrementally from the previous HEAD instead of walking all history.
+    Falls back to get_git_snapshot() if the helper process is unavailable.
+    """
+
+    def __init__(self, project_dir: Path):
+        self.project_dir = project_dir
+        self._proc: subprocess.Popen | None = None
+        self._finalizer = None
+        self._last_head: str | None = None
+        self._last_count = 0
+
+    def _start(self) -> subprocess.Popen | None:
+        if self._proc is None or self._proc.poll() is not None:
+            try:
+                self._proc = subprocess.Popen(
+                    ["git", "cat-file", "--batch-check=%(objectname)"],
+                    cwd=self.project_dir,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                )
+            except OSError as e:
+                logger.debug(f"Could not start git helper process: {e}")
+                self._proc = None
+                return None
+            self._finalizer = weakref.finalize(self, _close_process, self._proc)
+        return self._proc
+
+    def head_sha(self) -> str | None:
+        """Get the hash of the latest commit (HEAD), or None if there is none."""
+        proc = self._start()
+        if proc is None:
+            return get_latest_commit(self.project_dir)
+        try:
+            proc.stdin.write("HEAD\n")
+            proc.stdin.flush()
+            line = proc.stdout.readline().strip()
+        except (OSError, ValueError) as e:
+            logger.debug(f"git helper process failed: {e}")
+            self.close()
+            return get_latest_commit(self.project_dir)
+        if not line:
+            # Helper exited (e.g. not a repository)
+            self.close()
+            return get_latest_commit(self.project_dir)
+        if line.endswith(" missing"):
+            return None
+        return line
+
+    def snapshot(self) -> tuple[str | None, int]:
+        """
+        Get the latest commit hash and total commit count.
+
+        When HEAD moved since the last call, the count is adjusted with
+        ``rev-list --count --left-right old...new``, which also handles
+        amends and resets.
+        """
+        head = self.head_sha()
+        if head is None:
+            self._last_head, self._last_count = None, 0
+            return None, 0
+        if head == self._last_head:
+            return head, self._last_count
+
+        count = None
+        if self._last_head:
+            output = _git_output(
+                self.project_dir,
+                "rev-list",
+                "--count",
+                "--left-right",
+                f"{self._last_head}...{head}",
+            )
+            try:
+                removed, added = (int(n) for n in (output or "").split())
+                count = self._last_count - removed + added
+            except ValueError:
+                count = None
+        if count is None:
+            count = get_commit_count(self.project_dir)
+
+        self._last_head, self._last_count = head, count
+        return head, count
+
+    def close(self) -> None:
+        """Stop the helper process."""
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._proc = None
+
+    def __enter__(self) -> "GitSession":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _close_process(proc: subprocess.Popen) -> None:
+    """Close a helper process's stdin and wait for it to exit."""
+    try:
+        proc.stdin.close()
+        proc.wait(timeout=5)
+    except Exception:
+        proc.kill()
+
+
+def _subtask_index(plan: dict) -> dict[str, tuple[dict, dict]] | None:
+    """
+    Get a {subtask_id: (phase, subtask)} index for a cached plan.
+
+    Only plans returned by load_implementation_plan (which are read-only) are
+    indexed; the most recent index is memoized by plan identity. Returns None
+    for other plans, which callers scan directly.
+    """
+    global _SUBTASK_INDEX
+    memo = _SUBTASK_INDEX
+    if memo is not None and memo[0] is plan:
+        return memo[1]
+
+    if not is_cached_plan(plan):
         return None
 
+    index: dict[str, tuple[dict, dict]] = {}
+    for phase in plan.get("phases", []):
+        for subtask in phase.get("subtasks", []):
+            # First occurrence wins, matching a linear scan
+            index.setdefault(subtask.get("id"), (phase, subtask))
+    _SUBTASK_INDEX = (plan, index)
+    return index
+
 
-def find_subtask_in_plan(plan: dict, subtask_id: str) -> dict | None:
-    """Find a subtask by ID in the plan."""
+def _find_subtask_entry(plan: dict, subtask_id: str) -> tuple[dict, dict] | None:
+    """Find (phase, subtask) for a subtask ID in the plan."""
+    index = _subtask_index(plan)
+    if index is not None:
+        return index.get(subtask_id)
     for phase in plan.get("phases", []):
         for subtask in phase.get("subtasks", []):
             if subtask.get("id") == subtask_id:
-                return subtask
+                return phase, subtask
     return None
 
 
+def find_subtask_in_plan(plan: dict, subtask_id: str) -> dict | None:
+    """Find a subtask by ID in the plan."""
+    entry = _find_subtask_entry(plan, subtask_id)
+    return entry[1] if entry else None
+
+
 def find_phase_for_subtask(plan: dict, subtask_id: str) -> dict | None:
     """Find the phase containing a subtask."""
-    for phase in plan.get("phases", []):
-        for subtask in phase.get("subtasks", []):
-            if subtask.get("id") == subtask_id:
-                return phase
-    return None
+    entry = _find_subtask_entry(plan, subtask_id)
+    return entry[0] if entry else None
 
 
 def sync_plan_to_source(spec_dir: Path, source_spec_dir: Path | None) -> bool:
@@ -11,15 +11,32 @@ Falls back to generic insights if extraction fails (never blocks the build).
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import codecs
+import hashlib
+import itertools
 import json
 import logging
 import os
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Check for libgit2 bindings (optional - avoids spawning git per helper call)
+try:
+    import pygit2
+
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
+    pygit2 = None
+
 # Check for Claude SDK availability
 try:
     from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
@@ -31,23 +48,89 @@ except ImportError:
     ClaudeSDKClient = None
 
 from core.auth import ensure_claude_code_oauth_token, get_auth_token
+from core.plan_io import _json_loads, load_implementation_plan
 
 # Default model for insight extraction (fast and cheap)
 DEFAULT_EXTRACTION_MODEL = "claude-3-5-haiku-latest"
 
+# System prompt for the extraction client
+EXTRACTION_SYSTEM_PROMPT = (
+    "You are an expert code analyst. You extract structured insights from coding sessions. "
+    "Always respond with valid JSON only, no markdown formatting or explanations."
+)
+
 # Maximum diff size to send to the LLM (avoid context limits)
 MAX_DIFF_CHARS = 15000
 
+# Maximum commits (and characters of commit subjects) to include
+MAX_COMMITS_TO_INCLUDE = 20
+MAX_COMMIT_MESSAGES_CHARS = 4000
+
+# Maximum number of files whose diffs are sent (largest changes first)
+MAX_DIFF_FILES = 20
+
 # Maximum attempt history entries to include
 MAX_ATTEMPTS_TO_INCLUDE = 3
 
+# Maximum number of cached extraction results kept per project
+MAX_CACHED_EXTRACTIONS = 100
+
+# Extraction prompt (lives in the backend prompts/ directory)
+PROMPT_FILE = Path(__file__).parent.parent / "prompts" / "insight_extractor.md"
+
+# Git invocation that skips housekeeping and fsmonitor IPC during extraction
+GIT_COMMAND = [
+    "git",
+    "-c",
+    "gc.auto=0",
+    "-c",
+    "core.fsmonitor=false",
+    "-c",
+    "advice.detachedHead=false",
+    "--no-pager",
+]
+
+# Timeout for each git command (seconds)
+GIT_TIMEOUT = 10
+
+# Use libgit2 for diffs when available; subprocess git is the fallback
+USE_PYGIT2 = PYGIT2_AVAILABLE
+
+# Cache of opened repositories, keyed by project directory
+_REPO_CACHE: dict[str, Any] = {}
+_REPO_CACHE_LOCK = threading.Lock()
+
+
+# Auth token found by the last successful lookup (keychain lookups spawn a process)
+_cached_auth_token: str | None = None
+
+
+def _get_auth_token_cached() -> str | None:
+    """Get the auth token, reusing it once found (misses are retried)."""
+    global _cached_auth_token
+    if _cached_auth_token is None:
+        _cached_auth_token = get_auth_token()
+    return _cached_auth_token
+
+
+def _clear_auth_token_cache() -> None:
+    """Forget the cached token so the next lookup fetches it again."""
+    global _cached_auth_token
+    _cached_auth_token = None
+
+
+@lru_cache(maxsize=64)
+def _resolve_dir(path: str) -> str:
+    """Resolve a directory path once per process."""
+    return str(Path(path).resolve())
+
 
 def is_extraction_enabled() -> bool:
     """Check if insight extraction is enabled."""
     # Extraction requires Claude SDK and authentication token
     if not SDK_AVAILABLE:
         return False
-    if not get_auth_token():
+    if not _get_auth_token_cached():
         return False
     enabled_str = os.environ.get("INSIGHT_EXTRACTION_ENABLED", "true").lower()
     return enabled_str in ("true", "1", "yes")
@@ -63,6 +146,165 @@ def get_extraction_model() -> str:
 # =============================================================================
 
 
+def _get_repo(project_dir: Path) -> Any | None:
+    """
+    Get a cached pygit2 repository for the project directory.
+
+    Args:
+        project_dir: Project root directory
+
+    Returns:
+        pygit2.Repository, or None if pygit2 is disabled or no repo was found
+    """
+    if not USE_PYGIT2:
+        return None
+
+    key = str(project_dir)
+    with _REPO_CACHE_LOCK:
+        repo = _REPO_CACHE.get(key)
+        if repo is None:
+            try:
+                git_dir = pygit2.discover_repository(key)
+                if git_dir is None:
+                    return None
+                repo = pygit2.Repository(git_dir)
+            except Exception as e:
+                logger.debug(f"pygit2 could not open {project_dir}: {e}")
+                return None
+            _REPO_CACHE[key] = repo
+        return repo
+
+
+@atexit.register
+def _free_repos() -> None:
+    """Release cached pygit2 repositories (file handles, packfile maps)."""
+    with _REPO_CACHE_LOCK:
+        for repo in _REPO_CACHE.values():
+            try:
+                repo.free()
+            except Exception:
+                pass
+        _REPO_CACHE.clear()
+
+
+def _pygit2_diff(project_dir: Path, commit_before: str, commit_after: str) -> Any:
+    """Get a pygit2 Diff between two commits, or None if unavailable."""
+    repo = _get_repo(project_dir)
+    if repo is None:
+        return None
+    return repo.diff(commit_before, commit_after, context_lines=3)
+
+
+def _read_diff_output(
+    cmd: list[str], project_dir: Path, limit: int, timeout: float
+) -> tuple[str, bool]:
+    """
+    Run a git command and read its stdout up to a size limit in bytes.
+
+    The process is terminated once more than ``limit`` bytes have been read,
+    and only the kept prefix is decoded, so git never writes (and Python never
+    decodes) the discarded tail.
+
+    Returns:
+        Tuple of (decoded output, whether it was truncated)
+
+    Raises:
+        subprocess.TimeoutExpired: If the command runs longer than timeout
+    """
+    proc = subprocess.Popen(
+        cmd,
+        cwd=project_dir,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    timed_out = threading.Event()
+
+    def _kill() -> None:
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, _kill)
+    timer.start()
+    chunks = []
+    try:
+        total = 0
+        while total <= limit:
+            chunk = proc.stdout.read(8192)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            total += len(chunk)
+        if total > limit:
+            proc.terminate()
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+        proc.wait()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+
+    raw = b"".join(chunks)
+    truncated = len(raw) > limit
+    # A non-final incremental decode drops a multi-byte character cut in half
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    return decoder.decode(raw[:limit], final=not truncated), truncated
+
+
+def _git(project_dir: Path, *args: str) -> subprocess.CompletedProcess:
+    """Run a git command in the project directory and capture its output."""
+    return subprocess.run(
+        [*GIT_COMMAND, *args],
+        cwd=project_dir,
+        capture_output=True,
+        text=True,
+        timeout=GIT_TIMEOUT,
+    )
+
+
+def _get_numstat(
+    project_dir: Path, commit_before: str, commit_after: str
+) -> tuple[list[str], list[int]]:
+    """
+    Get changed paths and their churn (lines added + deleted) between commits.
+
+    Binary files count as zero churn.
+    """
+    result = _git(
+        project_dir,
+        "diff",
+        "--numstat",
+        "-z",
+        "--no-renames",
+        commit_before,
+        commit_after,
+    )
+    paths = []
+    churn = []
+    for entry in result.stdout.split("\0"):
+        added, _, rest = entry.partition("\t")
+        deleted, _, path = rest.partition("\t")
+        if not path:
+            continue
+        paths.append(path)
+        churn.append(
+            (int(added) if added.isdigit() else 0)
+            + (int(deleted) if deleted.isdigit() else 0)
+        )
+    return paths, churn
+
+
+def _largest_changes(items, churn: list[int]) -> list:
+    """
+    Keep the MAX_DIFF_FILES items with the most churn, in their original order.
+    """
+    items = list(items)
+    if len(items) <= MAX_DIFF_FILES:
+        return items
+    ranked = sorted(range(len(items)), key=lambda i: churn[i], reverse=True)
+    return [items[i] for i in sorted(ranked[:MAX_DIFF_FILES])]
+
+
 def get_session_diff(
     project_dir: Path,
     commit_before: str | None,
@@ -86,20 +328,42 @@ def get_session_diff(
         return "(No changes - same commit)"
 
     try:
-        result = subprocess.run(
-            ["git", "diff", commit_before, commit_after],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        diff = result.stdout
-
-        if len(diff) > MAX_DIFF_CHARS:
-            # Truncate and add note
-            diff = (
-                diff[:MAX_DIFF_CHARS] + f"\n\n... (truncated, {len(diff)} chars total)"
+        pygit2_diff = _pygit2_diff(project_dir, commit_before, commit_after)
+        if pygit2_diff is not None:
+            patches = list(pygit2_diff)
+            kept = set(
+                _largest_changes(
+                    range(len(patches)),
+                    [sum(patch.line_stats[1:]) for patch in patches],
+                )
+            )
+            omitted = len(patches) - len(kept)
+            diff = "".join(
+                patch.text or "" for i, patch in enumerate(patches) if i in kept
+            )
+            if len(diff) > MAX_DIFF_CHARS:
+                # Truncate and add note
+                diff = (
+                    diff[:MAX_DIFF_CHARS]
+                    + f"\n\n... (truncated, {len(diff)} chars total)"
+                )
+        else:
+            paths, churn = _get_numstat(project_dir, commit_before, commit_after)
+            selected = _largest_changes(paths, churn)
+            omitted = len(paths) - len(selected)
+            cmd = [*GIT_COMMAND, "diff", commit_before, commit_after]
+            if omitted:
+                cmd += ["--", *selected]
+            # Stop reading once past the limit instead of buffering huge diffs;
+            # the limit is applied to bytes, which approximates characters
+            diff, truncated = _read_diff_output(
+                cmd, project_dir, limit=MAX_DIFF_CHARS, timeout=GIT_TIMEOUT
             )
+            if truncated:
+                diff += f"\n\n... (truncated, over {MAX_DIFF_CHARS} bytes)"
+
+        if omitted:
+            diff += f"\n\n... ({omitted} smaller changed files not shown)"
 
         return diff if diff else "(Empty diff)"
 
@@ -131,12 +395,19 @@ def get_changed_files(
         return []
 
     try:
-        result = subprocess.run(
-            ["git", "diff", "--name-only", commit_before, commit_after],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-            timeout=10,
+        pygit2_diff = _pygit2_diff(project_dir, commit_before, commit_after)
+        if pygit2_diff is not None:
+            return [delta.new_file.path for delta in pygit2_diff.deltas]
+
+        # Plumbing diff-tree compares trees without rename detection or hunks
+        result = _git(
+            project_dir,
+            "diff-tree",
+            "-r",
+            "--no-commit-id",
+            "--name-only",
+            commit_before,
+            commit_after,
         )
         files = [f.strip() for f in result.stdout.strip().split("\n") if f.strip()]
         return files
@@ -151,25 +422,78 @@ def get_commit_messages(
     commit_before: str | None,
     commit_after: str | None,
 ) -> str:
-    """Get commit messages between two commits."""
+    """Get the most recent commit subjects between two commits (bounded)."""
     if not commit_before or not commit_after or commit_before == commit_after:
         return "(No commits)"
 
     try:
-        result = subprocess.run(
-            ["git", "log", "--oneline", f"{commit_before}..{commit_after}"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        return result.stdout.strip() if result.stdout.strip() else "(No commits)"
+        repo = _get_repo(project_dir)
+        if repo is not None:
+            walker = repo.walk(repo.revparse_single(commit_after).id)
+            walker.hide(repo.revparse_single(commit_before).id)
+            messages = "\n".join(
+                f"{commit.short_id} {commit.message.partition(chr(10))[0]}"
+                for commit in itertools.islice(walker, MAX_COMMITS_TO_INCLUDE)
+            )
+        else:
+            result = _git(
+                project_dir,
+                "log",
+                "--oneline",
+                f"--max-count={MAX_COMMITS_TO_INCLUDE}",
+                f"{commit_before}..{commit_after}",
+            )
+            messages = result.stdout.strip()
+
+        if len(messages) > MAX_COMMIT_MESSAGES_CHARS:
+            # Cut at the last complete line that fits
+            cut = messages.rfind("\n", 0, MAX_COMMIT_MESSAGES_CHARS)
+            messages = messages[: cut if cut > 0 else MAX_COMMIT_MESSAGES_CHARS]
+            messages += "\n... (truncated)"
+
+        return messages if messages else "(No commits)"
 
     except Exception as e:
         logger.warning(f"Failed to get commit messages: {e}")
         return f"(Failed: {e})"
 
 
+def _gather_git_info(
+    project_dir: Path,
+    commit_before: str | None,
+    commit_after: str | None,
+) -> tuple[str, list[str], str]:
+    """
+    Get the session diff, changed files, and commit messages together.
+
+    With subprocess git the three commands run concurrently, so the wall-clock
+    cost is the slowest command rather than the sum of all three. pygit2
+    repositories are not thread-safe, so that backend runs them in turn.
+
+    Args:
+        project_dir: Project root directory
+        commit_before: Commit hash before session
+        commit_after: Commit hash after session
+
+    Returns:
+        Tuple of (diff, changed_files, commit_messages)
+    """
+    args = (project_dir, commit_before, commit_after)
+
+    if _get_repo(project_dir) is not None:
+        return (
+            get_session_diff(*args),
+            get_changed_files(*args),
+            get_commit_messages(*args),
+        )
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        diff_future = executor.submit(get_session_diff, *args)
+        files_future = executor.submit(get_changed_files, *args)
+        messages_future = executor.submit(get_commit_messages, *args)
+        return diff_future.result(), files_future.result(), messages_future.result()
+
+
 # =============================================================================
 # Input Gathering
 # =============================================================================
@@ -204,14 +528,10 @@ def gather_extraction_inputs(
     # Get subtask description from implementation plan
     subtask_description = _get_subtask_description(spec_dir, subtask_id)
 
-    # Get git diff
-    diff = get_session_diff(project_dir, commit_before, commit_after)
-
-    # Get changed files
-    changed_files = get_changed_files(project_dir, commit_before, commit_after)
-
-    # Get commit messages
-    commit_messages = get_commit_messages(project_dir, commit_before, commit_after)
+    # Get git diff, changed files, and commit messages
+    diff, changed_files, commit_messages = _gather_git_info(
+        project_dir, commit_before, commit_after
+    )
 
     # Get attempt history
     attempt_history = _get_attempt_history(recovery_manager, subtask_id)
@@ -228,23 +548,33 @@ def gather_extraction_inputs(
     }
 
 
+@lru_cache(maxsize=32)
+def _read_text_cached(path: str, mtime_ns: int) -> str:
+    """Read a file, cached by path and modification time."""
+    return Path(path).read_text()
+
+
 def _get_subtask_description(spec_dir: Path, subtask_id: str) -> str:
     """Get subtask description from implementation plan."""
-    plan_file = spec_dir / "implementation_plan.json"
-    if not plan_file.exists():
-        return f"Subtask: {subtask_id}"
-
     try:
-        with open(plan_file) as f:
-            plan = json.load(f)
-
-        # Search through phases for the subtask
-        for phase in plan.get("phases", []):
-            for subtask in phase.get("subtasks", []):
-                if subtask.get("id") == subtask_id:
-                    return subtask.get("description", f"Subtask: {subtask_id}")
-
-        return f"Subtask: {subtask_id}"
+        # Shared, mtime-validated plan cache (read-only)
+        plan = load_implementation_plan(spec_dir)
+        if plan is None:
+            return f"Subtask: {subtask_id}"
+
+        # Search through phases for the subtask (single pass, stops at match)
+        subtask = next(
+            (
+                subtask
+                for phase in plan.get("phases", [])
+                for subtask in phase.get("subtasks", [])
+                if subtask.get("id") == subtask_id
+            ),
+            None,
+        )
+        if subtask is None:
+            return f"Subtask: {subtask_id}"
+        return subtask.get("description", f"Subtask: {subtask_id}")
 
     except Exception as e:
         logger.warning(f"Failed to load subtask description: {e}")
@@ -275,47 +605,41 @@ def _get_attempt_history(recovery_manager: Any, subtask_id: str) -> list[dict]:
 
 def _build_extraction_prompt(inputs: dict) -> str:
     """Build the prompt for insight extraction."""
-    prompt_file = Path(__file__).parent / "prompts" / "insight_extractor.md"
-
-    if prompt_file.exists():
-        base_prompt = prompt_file.read_text()
+    if PROMPT_FILE.exists():
+        base_prompt = _read_text_cached(
+            str(PROMPT_FILE), PROMPT_FILE.stat().st_mtime_ns
+        )
     else:
         # Fallback if prompt file missing
         base_prompt = """Extract structured insights from this coding session.
 Output ONLY valid JSON with: file_insights, patterns_discovered, gotchas_discovered, approach_outcome, recommendations"""
 
-    # Build session context
-    session_context = f"""
----
-
-## SESSION DATA
-
-### Subtask
-- **ID**: {inputs["subtask_id"]}
-- **Description**: {inputs["subtask_description"]}
-- **Session Number**: {inputs["session_num"]}
-- **Outcome**: {"SUCCESS" if inputs["success"] else "FAILED"}
-
-### Files Changed
-{chr(10).join(f"- {f}" for f in inputs["changed_files"]) if inputs["changed_files"] else "(No files changed)"}
-
-### Commit Messages
-{inputs["commit_messages"]}
-
-### Git Diff
-```diff
-{inputs["diff"]}
-```
-
-### Previous Attempts
-{_format_attempt_history(inputs["attempt_history"])}
-
----
-
-Now analyze this session and output ONLY the JSON object.
-"""
-
-    return base_prompt + session_context
+    changed_files = inputs["changed_files"]
+    if changed_files:
+        files_section = "\n".join(f"- {f}" for f in changed_files)
+    else:
+        files_section = "(No files changed)"
+
+    # Build session context; the diff is the bulk of the prompt, so join the
+    # pieces once instead of concatenating copies of it
+    parts = [
+        base_prompt,
+        "\n---\n\n## SESSION DATA\n\n### Subtask\n",
+        f"- **ID**: {inputs['subtask_id']}\n",
+        f"- **Description**: {inputs['subtask_description']}\n",
+        f"- **Session Number**: {inputs['session_num']}\n",
+        f"- **Outcome**: {'SUCCESS' if inputs['success'] else 'FAILED'}\n",
+        "\n### Files Changed\n",
+        files_section,
+        "\n\n### Commit Messages\n",
+        inputs["commit_messages"],
+        "\n\n### Git Diff\n```diff\n",
+        inputs["diff"],
+        "\n```\n\n### Previous Attempts\n",
+        _format_attempt_history(inputs["attempt_history"]),
+        "\n\n---\n\nNow analyze this session and output ONLY the JSON object.\n",
+    ]
+    return "".join(parts)
 
 
 def _format_attempt_history(attempts: list[dict]) -> str:
@@ -335,6 +659,49 @@ def _format_attempt_history(attempts: list[dict]) -> str:
     return "\n".join(lines)
 
 
+def _get_cache_path(project_dir: Path, model: str, prompt: str) -> Path:
+    """Get the cache file for an extraction, keyed on the model and prompt."""
+    key = hashlib.sha256(f"{model}\0{prompt}".encode()).hexdigest()
+    return project_dir / ".auto-claude" / "insights_cache" / f"{key}.json"
+
+
+def _load_cached_extraction(cache_path: Path) -> dict | None:
+    """Load a cached extraction result, marking it as recently used."""
+    try:
+        insights = _json_loads(cache_path.read_bytes())
+        if not isinstance(insights, dict):
+            raise ValueError(f"expected an object, got {type(insights).__name__}")
+        os.utime(cache_path)
+        return insights
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Discarding unreadable insights cache {cache_path}: {e}")
+        try:
+            cache_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        return None
+
+
+def _save_cached_extraction(cache_path: Path, insights: dict) -> None:
+    """Save an extraction result, evicting the least recently used entries."""
+    try:
+        cache_dir = cache_path.parent
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(insights))
+        tmp_path.replace(cache_path)
+
+        entries = list(cache_dir.glob("*.json"))
+        if len(entries) > MAX_CACHED_EXTRACTIONS:
+            entries.sort(key=lambda p: p.stat().st_mtime)
+            for stale in entries[: len(entries) - MAX_CACHED_EXTRACTIONS]:
+                stale.unlink(missing_ok=True)
+    except Exception as e:
+        logger.debug(f"Failed to cache insights: {e}")
+
+
 async def run_insight_extraction(
     inputs: dict, project_dir: Path | None = None
 ) -> dict | None:
@@ -352,7 +719,7 @@ async def run_insight_extraction(
         logger.warning("Claude SDK not available, skipping insight extraction")
         return None
 
-    if not get_auth_token():
+    if not _get_auth_token_cached():
         logger.warning("No authentication token found, skipping insight extraction")
         return None
 
@@ -362,11 +729,22 @@ async def run_insight_extraction(
     model = get_extraction_model()
     prompt = _build_extraction_prompt(inputs)
 
+    # Identical sessions (re-runs, retries) produce identical prompts
+    cache_path = _get_cache_path(project_dir, model, prompt) if project_dir else None
+    if cache_path:
+        cached = _load_cached_extraction(cache_path)
+        if cached is not None:
+            logger.info("Using cached insight extraction")
+            return cached
+
     # Use current directory if project_dir not specified
-    cwd = str(project_dir.resolve()) if project_dir else os.getcwd()
+    cwd = _resolve_dir(str(project_dir)) if project_dir else os.getcwd()
 
     try:
-        # Use simple_client for insight extraction
+        # Use simple_client for insight extraction. A fresh client per
+        # extraction is deliberate: a ClaudeSDKClient keeps the conversation
+        # across queries, so a pooled client would carry earlier sessions'
+        # prompts (and diffs) into every later extraction.
         from pathlib import Path
 
         from core.simple_client import create_simple_client
@@ -374,10 +752,7 @@ async def run_insight_extraction(
         client = create_simple_client(
             agent_type="insights",
             model=model,
-            system_prompt=(
-                "You are an expert code analyst. You extract structured insights from coding sessions. "
-                "Always respond with valid JSON only, no markdown formatting or explanations."
-            ),
+            system_prompt=EXTRACTION_SYSTEM_PROMPT,
             cwd=Path(cwd) if cwd else None,
         )
 
@@ -386,19 +761,24 @@ async def run_insight_extraction(
             await client.query(prompt)
 
             # Collect the response
-            response_text = ""
+            response_parts: list[str] = []
             async for msg in client.receive_response():
                 msg_type = type(msg).__name__
                 if msg_type == "AssistantMessage" and hasattr(msg, "content"):
                     for block in msg.content:
                         if hasattr(block, "text"):
-                            response_text += block.text
+                            response_parts.append(block.text)
 
         # Parse JSON from response
-        return parse_insights(response_text)
+        insights = parse_insights("".join(response_parts))
+        if insights and cache_path:
+            _save_cached_extraction(cache_path, insights)
+        return insights
 
     except Exception as e:
         logger.warning(f"Insight extraction failed: {e}")
+        # The token may have expired or been revoked mid-run; re-read it next time
+        _clear_auth_token_cache()
         return None
 
 
@@ -415,20 +795,16 @@ def parse_insights(response_text: str) -> dict | None:
     # Try to extract JSON from the response
     text = response_text.strip()
 
-    # Handle markdown code blocks
+    # Handle markdown code blocks (clean JSON starting with "{" skips this)
     if text.startswith("```"):
-        # Remove code block markers
-        lines = text.split("\n")
-        # Remove first line (```json or ```)
-        if lines[0].startswith("```"):
-            lines = lines[1:]
-        # Remove last line if it's ``
-        if lines and lines[-1].strip() == "```":
-            lines = lines[:-1]
-        text = "\n".join(lines)
+        # Remove first line (```json or ```) and the closing fence by slicing
+        newline = text.find("\n")
+        text = text[newline + 1 :] if newline != -1 else ""
+        if text.endswith("```"):
+            text = text[:-3].rstrip()
 
     try:
-        insights = json.loads(text)
+        insights = _json_loads(text)
 
         # Validate structure
         if not isinstance(insights, dict):
@@ -444,7 +820,8 @@ def parse_insights(response_text: str) -> dict | None:
 
         return insights
 
-    except json.JSONDecodeError as e:
+    except ValueError as e:
+        # json.JSONDecodeError and orjson.JSONDecodeError are ValueErrors
         logger.warning(f"Failed to parse insights JSON: {e}")
         logger.debug(f"Response text was: {text[:500]}")
         return None
@@ -495,8 +872,9 @@ async def extract_session_insights(
         return _get_generic_insights(subtask_id, success)
 
     try:
-        # Gather inputs
-        inputs = gather_extraction_inputs(
+        # Gather inputs (git subprocesses and file reads) off the event loop
+        inputs = await asyncio.to_thread(
+            gather_extraction_inputs,
             spec_dir=spec_dir,
             project_dir=project_dir,
             subtask_id=subtask_id,
@@ -507,6 +885,11 @@ async def extract_session_insights(
             recovery_manager=recovery_manager,
         )
 
+        # Nothing was committed, so there is nothing for the LLM to analyze
+        if not inputs["changed_files"] and inputs["commit_messages"] == "(No commits)":
+            logger.info("No commits or file changes to extract insights from")
+            return _get_generic_insights(subtask_id, success)
+
         # Run extraction
         extracted = await run_insight_extraction(inputs, project_dir=project_dir)
 
@@ -558,7 +941,6 @@ def _get_generic_insights(subtask_id: str, success: bool) -> dict:
 
 if __name__ == "__main__":
     import argparse
-    import asyncio
 
     parser = argparse.ArgumentParser(description="Test insight extraction")
     parser.add_argument("--spec-dir", type=Path, required=True, help="Spec directory")
@@ -22,11 +22,13 @@ from agents import (
     # Constants
     AUTO_CONTINUE_DELAY_SECONDS,
     HUMAN_INTERVENTION_FILE,
+    GitSession,
     # Memory functions
     debug_memory_system_status,
     find_phase_for_subtask,
     find_subtask_in_plan,
     get_commit_count,
+    get_git_snapshot,
     get_graphiti_context,
     # Utility functions
     get_latest_commit,
@@ -52,8 +54,10 @@ __all__ = [
     "save_session_to_graphiti",
     "run_agent_session",
     "post_session_processing",
+    "GitSession",
     "get_latest_commit",
     "get_commit_count",
+    "get_git_snapshot",
     "load_implementation_plan",
     "find_subtask_in_plan",
     "find_phase_for_subtask",
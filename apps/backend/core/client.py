@@ -19,7 +19,10 @@ import os
 import threading
 import time
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from claude_agent_sdk import ClaudeSDKClient
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +34,11 @@ logger = logging.getLogger(__name__)
 
 _PROJECT_INDEX_CACHE: dict[str, tuple[dict[str, Any], dict[str, bool], float]] = {}
 _CACHE_TTL_SECONDS = 300  # 5 minute TTL
-_CACHE_LOCK = threading.Lock()  # Protects _PROJECT_INDEX_CACHE access
+_CACHE_LOCK = threading.Lock()  # Protects _PROJECT_INDEX_CACHE and _MCP_CONFIG_CACHE
+
+# Parsed MCP settings from .auto-claude/.env, keyed by path and validated by
+# (mtime_ns, size)
+_MCP_CONFIG_CACHE: dict[str, tuple[tuple[int, int], dict]] = {}
 
 
 def _get_cached_project_data(
@@ -131,12 +138,23 @@ from agents.tools_pkg import (
     get_required_mcp_servers,
     is_tools_available,
 )
-from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
-from claude_agent_sdk.types import HookMatcher
 from core.auth import get_sdk_env_vars, require_auth_token
-from linear_updater import is_linear_enabled
 from prompts_pkg.project_context import detect_project_capabilities, load_project_index
-from security import bash_security_hook
+
+# Permission rules that don't depend on the project, built once at import
+_RELATIVE_FILE_RULES = (
+    "Read(./**)",
+    "Write(./**)",
+    "Edit(./**)",
+    "Glob(./**)",
+    "Grep(./**)",
+)
+_SHELL_AND_WEB_RULES = ("Bash(*)", "WebFetch(*)", "WebSearch(*)")
+_CONTEXT7_RULES = tuple(f"{tool}(*)" for tool in CONTEXT7_TOOLS)
+_LINEAR_RULES = tuple(f"{tool}(*)" for tool in LINEAR_TOOLS)
+_GRAPHITI_RULES = tuple(f"{tool}(*)" for tool in GRAPHITI_MCP_TOOLS)
+_ELECTRON_RULES = tuple(f"{tool}(*)" for tool in ELECTRON_TOOLS)
+_PUPPETEER_RULES = tuple(f"{tool}(*)" for tool in PUPPETEER_TOOLS)
 
 
 def _validate_custom_mcp_server(server: dict) -> bool:
@@ -304,6 +322,9 @@ def load_project_mcp_config(project_dir: Path) -> dict:
     """
     Load MCP configuration from project's .auto-claude/.env file.
 
+    The parsed file is cached until it changes on disk, so creating a client
+    for each session does not re-read and re-validate it.
+
     Returns a dict of MCP-related env vars:
     - CONTEXT7_ENABLED (default: true)
     - LINEAR_MCP_ENABLED (default: true)
@@ -320,9 +341,26 @@ def load_project_mcp_config(project_dir: Path) -> dict:
         Dict of MCP configuration values (string values, except CUSTOM_MCP_SERVERS which is parsed JSON)
     """
     env_path = project_dir / ".auto-claude" / ".env"
-    if not env_path.exists():
+    try:
+        st = env_path.stat()
+    except OSError:
         return {}
 
+    key = str(env_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _CACHE_LOCK:
+        cached = _MCP_CONFIG_CACHE.get(key)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, _parse_project_mcp_config(env_path))
+        with _CACHE_LOCK:
+            _MCP_CONFIG_CACHE[key] = cached
+
+    # Return a deep copy to prevent callers from corrupting the cache
+    return copy.deepcopy(cached[1])
+
+
+def _parse_project_mcp_config(env_path: Path) -> dict:
+    """Parse the MCP-related settings from a project .env file."""
     config = {}
     mcp_keys = {
         "CONTEXT7_ENABLED",
@@ -433,6 +471,33 @@ def load_claude_md(project_dir: Path) -> str | None:
     return None
 
 
+def _write_settings_file(
+    settings_file: Path, settings: dict, pretty: bool = False
+) -> bool:
+    """
+    Write settings as JSON, skipping the write if the file is already current.
+
+    Args:
+        settings_file: Path of the settings file
+        settings: Settings to serialize
+        pretty: Indent the JSON for reading; otherwise it is written compactly
+
+    Returns:
+        True if the file was written, False if it already had this content
+    """
+    if pretty:
+        rendered = json.dumps(settings, indent=2).encode()
+    else:
+        rendered = json.dumps(settings, separators=(",", ":")).encode()
+    try:
+        if settings_file.read_bytes() == rendered:
+            return False
+    except OSError:
+        pass
+    settings_file.write_bytes(rendered)
+    return True
+
+
 def create_client(
     project_dir: Path,
     spec_dir: Path,
@@ -441,7 +506,7 @@ def create_client(
     max_thinking_tokens: int | None = None,
     output_format: dict | None = None,
     agents: dict | None = None,
-) -> ClaudeSDKClient:
+) -> "ClaudeSDKClient":
     """
     Create a Claude Agent SDK client with multi-layered security.
 
@@ -481,6 +546,13 @@ def create_client(
        (see security.py for ALLOWED_COMMANDS)
     4. Tool filtering - Each agent type only sees relevant tools (prevents misuse)
     """
+    # Imported lazily so importing this module doesn't load the SDK, Linear
+    # integration or security hooks
+    from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
+    from claude_agent_sdk.types import HookMatcher
+    from linear_updater import is_linear_enabled
+    from security import bash_security_hook
+
     oauth_token = require_auth_token()
     # Ensure SDK can access it via its expected env var
     os.environ["CLAUDE_CODE_OAUTH_TOKEN"] = oauth_token
@@ -527,15 +599,16 @@ def create_client(
     graphiti_mcp_enabled = "graphiti" in required_servers
 
     # Determine browser tools for permissions (already in allowed_tools_list)
-    browser_tools_permissions = []
+    browser_tool_rules = ()
     if "electron" in required_servers:
-        browser_tools_permissions = ELECTRON_TOOLS
+        browser_tool_rules = _ELECTRON_RULES
     elif "puppeteer" in required_servers:
-        browser_tools_permissions = PUPPETEER_TOOLS
+        browser_tool_rules = _PUPPETEER_RULES
 
     # Create comprehensive security settings
     # Note: Using both relative paths ("./**") and absolute paths to handle
     # cases where Claude uses absolute paths for file operations
+    # Resolved once here and reused below (resolve() hits the filesystem)
     project_path_str = str(project_dir.resolve())
     spec_path_str = str(spec_dir.resolve())
     security_settings = {
@@ -545,11 +618,7 @@ def create_client(
             "allow": [
                 # Allow all file operations within the project directory
                 # Include both relative (./**) and absolute paths for compatibility
-                "Read(./**)",
-                "Write(./**)",
-                "Edit(./**)",
-                "Glob(./**)",
-                "Grep(./**)",
+                *_RELATIVE_FILE_RULES,
                 # Also allow absolute paths (Claude sometimes uses full paths)
                 f"Read({project_path_str}/**)",
                 f"Write({project_path_str}/**)",
@@ -561,41 +630,28 @@ def create_client(
                 f"Write({spec_path_str}/**)",
                 f"Edit({spec_path_str}/**)",
                 # Bash permission granted here, but actual commands are validated
-                # by the bash_security_hook (see security.py for allowed commands)
-                "Bash(*)",
-                # Allow web tools for documentation and research
-                "WebFetch(*)",
-                "WebSearch(*)",
+                # by the bash_security_hook (see security.py for allowed commands).
+                # Web tools are allowed for documentation and research
+                *_SHELL_AND_WEB_RULES,
                 # Allow MCP tools based on required servers
                 # Format: tool_name(*) allows all arguments
-                *(
-                    [f"{tool}(*)" for tool in CONTEXT7_TOOLS]
-                    if "context7" in required_servers
-                    else []
-                ),
-                *(
-                    [f"{tool}(*)" for tool in LINEAR_TOOLS]
-                    if "linear" in required_servers
-                    else []
-                ),
-                *(
-                    [f"{tool}(*)" for tool in GRAPHITI_MCP_TOOLS]
-                    if graphiti_mcp_enabled
-                    else []
-                ),
-                *[f"{tool}(*)" for tool in browser_tools_permissions],
+                *(_CONTEXT7_RULES if "context7" in required_servers else ()),
+                *(_LINEAR_RULES if "linear" in required_servers else ()),
+                *(_GRAPHITI_RULES if graphiti_mcp_enabled else ()),
+                *browser_tool_rules,
             ],
         },
     }
 
     # Write settings to a file in the project directory
     settings_file = project_dir / ".claude_settings.json"
-    with open(settings_file, "w") as f:
-        json.dump(security_settings, f, indent=2)
+    # Compact unless debugging, when a readable file is more useful
+    debug = os.environ.get("DEBUG", "").lower() in ("true", "1")
+    _write_settings_file(settings_file, security_settings, pretty=debug)
 
     print(f"Security settings: {settings_file}")
     print("   - Sandbox enabled (OS-level bash isolation)")
-    print(f"   - Filesystem restricted to: {project_dir.resolve()}")
+    print(f"   - Filesystem restricted to: {project_path_str}")
     print("   - Bash commands restricted to allowlist")
     if max_thinking_tokens:
         print(f"   - Extended thinking: {max_thinking_tokens:,} tokens")
@@ -705,7 +761,7 @@ def create_client(
     # Build system prompt
     base_prompt = (
         f"You are an expert full-stack developer building production-quality software. "
-        f"Your working directory is: {project_dir.resolve()}\n"
+        f"Your working directory is: {project_path_str}\n"
         f"Your filesystem access is RESTRICTED to this directory only. "
         f"Use relative paths (starting with ./) for all file operations. "
         f"Never use absolute paths or try to access files outside your working directory.\n\n"
@@ -738,7 +794,7 @@ def create_client(
             ],
         },
         "max_turns": 1000,
-        "cwd": str(project_dir.resolve()),
+        "cwd": project_path_str,
         "settings": str(settings_file.resolve()),
         "env": sdk_env,  # Pass ANTHROPIC_BASE_URL etc. to subprocess
         "max_thinking_tokens": max_thinking_tokens,  # Extended thinking budget
@@ -0,0 +1,80 @@
+"""
+Implementation Plan Loading
+===========================
+
+Cached reading of a spec's implementation_plan.json, shared by the progress
+helpers in core and by the agent loop (re-exported from agents.utils).
+"""
+
+import json
+import threading
+from pathlib import Path
+
+# Check for orjson (optional - faster plan parsing; json.loads also takes bytes)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+    _json_loads = orjson.loads
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+    _json_loads = json.loads
+
+# Parsed implementation plans keyed by path, validated by (mtime_ns, size)
+_PLAN_CACHE: dict[str, tuple[tuple[int, int], dict]] = {}
+_PLAN_CACHE_LOCK = threading.Lock()  # Protects _PLAN_CACHE access
+
+
+def load_implementation_plan(spec_dir: Path) -> dict | None:
+    """
+    Load the implementation plan JSON.
+
+    The parsed plan is cached until the file's mtime or size changes, so
+    repeated calls within a session don't re-read it. The returned dict is
+    shared with the cache and must be treated as read-only.
+    """
+    plan_file = spec_dir / "implementation_plan.json"
+    try:
+        stat = plan_file.stat()
+    except OSError:
+        return None
+
+    key = str(plan_file)
+    version = (stat.st_mtime_ns, stat.st_size)
+    with _PLAN_CACHE_LOCK:
+        cached = _PLAN_CACHE.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+    try:
+        plan = _json_loads(plan_file.read_bytes())
+    except (OSError, ValueError):  # Includes JSON and Unicode decode errors
+        return None
+
+    with _PLAN_CACHE_LOCK:
+        _PLAN_CACHE[key] = (version, plan)
+    return plan
+
+
+def invalidate_plan_cache(spec_dir: Path | None = None) -> None:
+    """
+    Drop cached implementation plans.
+
+    Only needed when a plan is rewritten within the same mtime tick and size;
+    normal edits are picked up automatically.
+
+    Args:
+        spec_dir: Spec directory to invalidate, or None to clear all entries
+    """
+    with _PLAN_CACHE_LOCK:
+        if spec_dir is None:
+            _PLAN_CACHE.clear()
+        else:
+            _PLAN_CACHE.pop(str(spec_dir / "implementation_plan.json"), None)
+
+
+def is_cached_plan(plan: dict) -> bool:
+    """Whether plan is a (read-only) object returned by load_implementation_plan."""
+    with _PLAN_CACHE_LOCK:
+        return any(entry[1] is plan for entry in _PLAN_CACHE.values())
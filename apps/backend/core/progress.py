@@ -6,11 +6,15 @@ Functions for tracking and displaying progress of the autonomous coding agent.
 Uses subtask-based implementation plans (implementation_plan.json).
 
 Enhanced with colored output, icons, and better visual formatting.
+
+Plans are read through core.plan_io.load_implementation_plan, which caches the
+parsed file until it changes, so the helpers below can be called back-to-back
+without re-reading it.
 """
 
-import json
 from pathlib import Path
 
+from core.plan_io import load_implementation_plan
 from ui import (
     Icons,
     bold,
@@ -25,6 +29,37 @@ from ui import (
     warning,
 )
 
+# Tally for the most recently loaded plan: (plan, tally). Plans returned by
+# load_implementation_plan are shared read-only objects, so identity is a safe
+# key and a changed file yields a new plan object.
+_LAST_TALLY: tuple[dict, tuple[dict, list[tuple[int, int, bool]]]] | None = None
+
+
+def _plan_stats(spec_dir: Path) -> tuple[dict, list[tuple[int, int, bool]]]:
+    """
+    Get the tally of the spec's plan, walking it at most once per plan version.
+
+    The spec_dir-based helpers below all go through this, so checking
+    completion, percentage and the summary for the same plan costs one pass.
+    Callers must not modify the returned counts.
+    """
+    return _tally_loaded_plan(load_implementation_plan(spec_dir))
+
+
+def _tally_loaded_plan(
+    plan: dict | None,
+) -> tuple[dict, list[tuple[int, int, bool]]]:
+    """Tally a plan from load_implementation_plan, memoized by identity."""
+    global _LAST_TALLY
+    if plan is None:
+        return _tally_plan({})
+    memo = _LAST_TALLY
+    if memo is not None and memo[0] is plan:
+        return memo[1]
+    tally = _tally_plan(plan)
+    _LAST_TALLY = (plan, tally)
+    return tally
+
 
 def count_subtasks(spec_dir: Path) -> tuple[int, int]:
     """
@@ -36,38 +71,41 @@ def count_subtasks(spec_dir: Path) -> tuple[int, int]:
     Returns:
         (completed_count, total_count)
     """
-    plan_file = spec_dir / "implementation_plan.json"
+    counts = _plan_stats(spec_dir)[0]
+    return counts["completed"], counts["total"]
 
-    if not plan_file.exists():
-        return 0, 0
 
-    try:
-        with open(plan_file) as f:
-            plan = json.load(f)
+def count_subtasks_detailed(spec_dir: Path) -> dict:
+    """
+    Count subtasks by status.
 
-        total = 0
-        completed = 0
+    Returns:
+        Dict with completed, in_progress, pending, failed counts
+    """
+    return dict(_plan_stats(spec_dir)[0])
 
-        for phase in plan.get("phases", []):
-            for subtask in phase.get("subtasks", []):
-                total += 1
-                if subtask.get("status") == "completed":
-                    completed += 1
 
-        return completed, total
-    except (OSError, json.JSONDecodeError):
-        return 0, 0
+def count_subtasks_in_plan(plan: dict) -> dict:
+    """
+    Count subtasks by status in an already-loaded implementation plan.
 
+    Args:
+        plan: Parsed implementation_plan.json
 
-def count_subtasks_detailed(spec_dir: Path) -> dict:
+    Returns:
+        Dict with completed, in_progress, pending, failed and total counts
     """
-    Count subtasks by status.
+    return _tally_plan(plan)[0]
 
-    Returns:
-        Dict with completed, in_progress, pending, failed counts
+
+def _tally_plan(plan: dict) -> tuple[dict, list[tuple[int, int, bool]]]:
     """
-    plan_file = spec_dir / "implementation_plan.json"
+    Count subtasks by status, overall and per phase, in a single pass.
 
+    Returns:
+        (counts as from count_subtasks_in_plan,
+         [(completed, total, has_in_progress) for each phase])
+    """
     result = {
         "completed": 0,
         "in_progress": 0,
@@ -75,40 +113,59 @@ def count_subtasks_detailed(spec_dir: Path) -> dict:
         "failed": 0,
         "total": 0,
     }
+    phase_tallies = []
+
+    for phase in plan.get("phases", []):
+        phase_completed = phase_total = 0
+        has_in_progress = False
+        for subtask in phase.get("subtasks", []):
+            phase_total += 1
+            status = subtask.get("status", "pending")
+            if status == "completed":
+                phase_completed += 1
+            elif status == "in_progress":
+                has_in_progress = True
+            if status in result:
+                result[status] += 1
+            else:
+                result["pending"] += 1
+        result["total"] += phase_total
+        phase_tallies.append((phase_completed, phase_total, has_in_progress))
+
+    return result, phase_tallies
 
-    if not plan_file.exists():
-        return result
 
-    try:
-        with open(plan_file) as f:
-            plan = json.load(f)
+def is_build_complete(spec_dir: Path) -> bool:
+    """
+    Check if all subtasks are completed.
 
-        for phase in plan.get("phases", []):
-            for subtask in phase.get("subtasks", []):
-                result["total"] += 1
-                status = subtask.get("status", "pending")
-                if status in result:
-                    result[status] += 1
-                else:
-                    result["pending"] += 1
+    Args:
+        spec_dir: Directory containing implementation_plan.json
 
-        return result
-    except (OSError, json.JSONDecodeError):
-        return result
+    Returns:
+        True if all subtasks complete, False otherwise
+    """
+    counts = _plan_stats(spec_dir)[0]
+    return 0 < counts["total"] == counts["completed"]
 
 
-def is_build_complete(spec_dir: Path) -> bool:
+def is_build_complete_in_plan(plan: dict) -> bool:
     """
-    Check if all subtasks are completed.
+    Check if all subtasks are completed in an already-loaded plan.
 
     Args:
-        spec_dir: Directory containing implementation_plan.json
+        plan: Parsed implementation_plan.json
 
     Returns:
         True if all subtasks complete, False otherwise
     """
-    completed, total = count_subtasks(spec_dir)
-    return total > 0 and completed == total
+    total = 0
+    for phase in plan.get("phases", []):
+        for subtask in phase.get("subtasks", []):
+            if subtask.get("status") != "completed":
+                return False
+            total += 1
+    return total > 0
 
 
 def get_progress_percentage(spec_dir: Path) -> float:
@@ -163,15 +220,47 @@ def print_session_header(
     print()
 
 
-def print_progress_summary(spec_dir: Path, show_next: bool = True) -> None:
-    """Print a summary of current progress with enhanced formatting."""
-    completed, total = count_subtasks(spec_dir)
+def print_progress_summary(
+    spec_dir: Path,
+    show_next: bool = True,
+    plan: dict | None = None,
+    previous: dict | None = None,
+) -> dict:
+    """
+    Print a summary of current progress with enhanced formatting.
+
+    Args:
+        spec_dir: Directory containing implementation_plan.json
+        show_next: Whether to show the next subtask
+        plan: Already-loaded plan; if None, the plan file is read once
+        previous: Counts returned by an earlier call; when given, the
+            subtasks completed since then are shown
+
+    Returns:
+        Subtask counts for the plan (see count_subtasks_in_plan)
+    """
+    if plan is None:
+        plan = load_implementation_plan(spec_dir)
+        counts, phase_tallies = _tally_loaded_plan(plan)
+        plan = plan or {}
+    else:
+        counts, phase_tallies = _tally_plan(plan)
+    completed, total = counts["completed"], counts["total"]
 
     if total > 0:
         print()
         # Progress bar
         print(f"Progress: {progress_bar(completed, total, width=40)}")
 
+        # Change since the previous summary
+        if previous is not None and completed != previous["completed"]:
+            print(
+                muted(
+                    f"  {completed - previous['completed']:+d} completed "
+                    f"({previous['completed']}/{previous['total']} -> {completed}/{total})"
+                )
+            )
+
         # Status message
         if completed == total:
             print_status("BUILD COMPLETE - All subtasks completed!", "success")
@@ -180,61 +269,51 @@ def print_progress_summary(spec_dir: Path, show_next: bool = True) -> None:
             print_status(f"{remaining} subtasks remaining", "info")
 
         # Phase summary
-        try:
-            with open(spec_dir / "implementation_plan.json") as f:
-                plan = json.load(f)
-
-            print("\nPhases:")
-            for phase in plan.get("phases", []):
-                phase_subtasks = phase.get("subtasks", [])
-                phase_completed = sum(
-                    1 for s in phase_subtasks if s.get("status") == "completed"
+        print("\nPhases:")
+        phases = plan.get("phases", [])
+        # Completion by phase id or number; the first matching phase wins
+        phase_done = {}
+        for phase, (phase_completed, phase_total, _) in zip(phases, phase_tallies):
+            done = phase_completed == phase_total
+            phase_done.setdefault(phase.get("id"), done)
+            phase_done.setdefault(phase.get("phase"), done)
+
+        for phase, (phase_completed, phase_total, has_in_progress) in zip(
+            phases, phase_tallies
+        ):
+            phase_name = phase.get("name", phase.get("id", "Unknown"))
+
+            if phase_completed == phase_total:
+                status = "complete"
+            elif phase_completed > 0 or has_in_progress:
+                status = "in_progress"
+            else:
+                # Check if blocked by dependencies
+                deps = phase.get("depends_on", [])
+                all_deps_complete = all(phase_done.get(dep, True) for dep in deps)
+                status = "pending" if all_deps_complete else "blocked"
+
+            print_phase_status(phase_name, phase_completed, phase_total, status)
+
+        # Show next subtask if requested
+        if show_next and completed < total:
+            next_subtask = get_next_subtask_in_plan(plan)
+            if next_subtask:
+                print()
+                next_id = next_subtask.get("id", "unknown")
+                next_desc = next_subtask.get("description", "")
+                if len(next_desc) > 60:
+                    next_desc = next_desc[:57] + "..."
+                print(
+                    f"  {icon(Icons.ARROW_RIGHT)} Next: {highlight(next_id)} - {next_desc}"
                 )
-                phase_total = len(phase_subtasks)
-                phase_name = phase.get("name", phase.get("id", "Unknown"))
-
-                if phase_completed == phase_total:
-                    status = "complete"
-                elif phase_completed > 0 or any(
-                    s.get("status") == "in_progress" for s in phase_subtasks
-                ):
-                    status = "in_progress"
-                else:
-                    # Check if blocked by dependencies
-                    deps = phase.get("depends_on", [])
-                    all_deps_complete = True
-                    for dep_id in deps:
-                        for p in plan.get("phases", []):
-                            if p.get("id") == dep_id or p.get("phase") == dep_id:
-                                p_subtasks = p.get("subtasks", [])
-                                if not all(
-                                    s.get("status") == "completed" for s in p_subtasks
-                                ):
-                                    all_deps_complete = False
-                                break
-                    status = "pending" if all_deps_complete else "blocked"
-
-                print_phase_status(phase_name, phase_completed, phase_total, status)
-
-            # Show next subtask if requested
-            if show_next and completed < total:
-                next_subtask = get_next_subtask(spec_dir)
-                if next_subtask:
-                    print()
-                    next_id = next_subtask.get("id", "unknown")
-                    next_desc = next_subtask.get("description", "")
-                    if len(next_desc) > 60:
-                        next_desc = next_desc[:57] + "..."
-                    print(
-                        f"  {icon(Icons.ARROW_RIGHT)} Next: {highlight(next_id)} - {next_desc}"
-                    )
-
-        except (OSError, json.JSONDecodeError):
-            pass
+
     else:
         print()
         print_status("No implementation subtasks yet - planner needs to run", "pending")
 
+    return dict(counts)
+
 
 def print_build_complete_banner(spec_dir: Path) -> None:
     """Print a completion banner."""
@@ -276,6 +355,10 @@ def print_paused_banner(
     print(box(content, width=70, style="heavy"))
 
 
+# Slots in get_plan_summary's status tally; any other status counts as pending
+_SUMMARY_STATUS_SLOTS = {"completed": 0, "in_progress": 1, "failed": 2}
+
+
 def get_plan_summary(spec_dir: Path) -> dict:
     """
     Get a detailed summary of implementation plan status.
@@ -286,9 +369,9 @@ def get_plan_summary(spec_dir: Path) -> dict:
     Returns:
         Dictionary with plan statistics
     """
-    plan_file = spec_dir / "implementation_plan.json"
+    plan = load_implementation_plan(spec_dir)
 
-    if not plan_file.exists():
+    if plan is None:
         return {
             "workflow_type": None,
             "total_phases": 0,
@@ -300,103 +383,78 @@ def get_plan_summary(spec_dir: Path) -> dict:
             "phases": [],
         }
 
-    try:
-        with open(plan_file) as f:
-            plan = json.load(f)
-
-        summary = {
-            "workflow_type": plan.get("workflow_type"),
-            "total_phases": len(plan.get("phases", [])),
-            "total_subtasks": 0,
-            "completed_subtasks": 0,
-            "pending_subtasks": 0,
-            "in_progress_subtasks": 0,
-            "failed_subtasks": 0,
-            "phases": [],
-        }
+    # Status tallies as list slots: completed, in_progress, failed, pending
+    status_counts = [0, 0, 0, 0]
+    phases = []
+
+    for phase in plan.get("phases", []):
+        subtasks = []
+        phase_completed = 0
+
+        for subtask in phase.get("subtasks", []):
+            status = subtask.get("status", "pending")
+            slot = _SUMMARY_STATUS_SLOTS.get(status, 3)
+            status_counts[slot] += 1
+            if slot == 0:
+                phase_completed += 1
+
+            subtasks.append(
+                {
+                    "id": subtask.get("id"),
+                    "description": subtask.get("description"),
+                    "status": status,
+                    "service": subtask.get("service"),
+                }
+            )
 
-        for phase in plan.get("phases", []):
-            phase_info = {
+        phases.append(
+            {
                 "id": phase.get("id"),
                 "phase": phase.get("phase"),
                 "name": phase.get("name"),
-                "depends_on": phase.get("depends_on", []),
-                "subtasks": [],
-                "completed": 0,
-                "total": 0,
+                "depends_on": list(phase.get("depends_on", [])),
+                "subtasks": subtasks,
+                "completed": phase_completed,
+                "total": len(subtasks),
             }
-
-            for subtask in phase.get("subtasks", []):
-                status = subtask.get("status", "pending")
-                summary["total_subtasks"] += 1
-                phase_info["total"] += 1
-
-                if status == "completed":
-                    summary["completed_subtasks"] += 1
-                    phase_info["completed"] += 1
-                elif status == "in_progress":
-                    summary["in_progress_subtasks"] += 1
-                elif status == "failed":
-                    summary["failed_subtasks"] += 1
-                else:
-                    summary["pending_subtasks"] += 1
-
-                phase_info["subtasks"].append(
-                    {
-                        "id": subtask.get("id"),
-                        "description": subtask.get("description"),
-                        "status": status,
-                        "service": subtask.get("service"),
-                    }
-                )
-
-            summary["phases"].append(phase_info)
-
-        return summary
-
-    except (OSError, json.JSONDecodeError):
-        return {
-            "workflow_type": None,
-            "total_phases": 0,
-            "total_subtasks": 0,
-            "completed_subtasks": 0,
-            "pending_subtasks": 0,
-            "in_progress_subtasks": 0,
-            "failed_subtasks": 0,
-            "phases": [],
-        }
+        )
+
+    completed, in_progress, failed, pending = status_counts
+    summary = {
+        "workflow_type": plan.get("workflow_type"),
+        "total_phases": len(phases),
+        "total_subtasks": sum(status_counts),
+        "completed_subtasks": completed,
+        "pending_subtasks": pending,
+        "in_progress_subtasks": in_progress,
+        "failed_subtasks": failed,
+        "phases": phases,
+    }
+    return summary
 
 
 def get_current_phase(spec_dir: Path) -> dict | None:
     """Get the current phase being worked on."""
-    plan_file = spec_dir / "implementation_plan.json"
-
-    if not plan_file.exists():
-        return None
-
-    try:
-        with open(plan_file) as f:
-            plan = json.load(f)
-
-        for phase in plan.get("phases", []):
-            subtasks = phase.get("subtasks", [])
-            # Phase is current if it has incomplete subtasks and dependencies are met
-            has_incomplete = any(s.get("status") != "completed" for s in subtasks)
-            if has_incomplete:
-                return {
-                    "id": phase.get("id"),
-                    "phase": phase.get("phase"),
-                    "name": phase.get("name"),
-                    "completed": sum(
-                        1 for s in subtasks if s.get("status") == "completed"
-                    ),
-                    "total": len(subtasks),
-                }
-
-        return None
+    plan = load_implementation_plan(spec_dir)
+    return get_current_phase_in_plan(plan) if plan is not None else None
+
+
+def get_current_phase_in_plan(plan: dict) -> dict | None:
+    """Get the current phase being worked on from an already-loaded plan."""
+    for phase in plan.get("phases", []):
+        subtasks = phase.get("subtasks", [])
+        # Phase is current if it has incomplete subtasks and dependencies are met
+        has_incomplete = any(s.get("status") != "completed" for s in subtasks)
+        if has_incomplete:
+            return {
+                "id": phase.get("id"),
+                "phase": phase.get("phase"),
+                "name": phase.get("name"),
+                "completed": sum(1 for s in subtasks if s.get("status") == "completed"),
+                "total": len(subtasks),
+            }
 
-    except (OSError, json.JSONDecodeError):
-        return None
+    return None
 
 
 def get_next_subtask(spec_dir: Path) -> dict | None:
@@ -409,50 +467,50 @@ def get_next_subtask(spec_dir: Path) -> dict | None:
     Returns:
         The next subtask dict to work on, or None if all complete
     """
-    plan_file = spec_dir / "implementation_plan.json"
+    plan = load_implementation_plan(spec_dir)
+    return get_next_subtask_in_plan(plan) if plan is not None else None
 
-    if not plan_file.exists():
-        return None
 
-    try:
-        with open(plan_file) as f:
-            plan = json.load(f)
+def get_next_subtask_in_plan(plan: dict) -> dict | None:
+    """
+    Find the next subtask to work on in an already-loaded plan.
 
-        phases = plan.get("phases", [])
+    Args:
+        plan: Parsed implementation_plan.json
 
-        # Build a map of phase completion
-        phase_complete = {}
-        for phase in phases:
-            phase_id = phase.get("id") or phase.get("phase")
-            subtasks = phase.get("subtasks", [])
-            phase_complete[phase_id] = all(
-                s.get("status") == "completed" for s in subtasks
-            )
+    Returns:
+        The next subtask dict to work on, or None if all complete
+    """
+    phases = plan.get("phases", [])
+
+    # Build a map of phase completion
+    phase_complete = {}
+    for phase in phases:
+        phase_id = phase.get("id") or phase.get("phase")
+        subtasks = phase.get("subtasks", [])
+        phase_complete[phase_id] = all(s.get("status") == "completed" for s in subtasks)
+
+    # Find next available subtask
+    for phase in phases:
+        phase_id = phase.get("id") or phase.get("phase")
+        depends_on = phase.get("depends_on", [])
+
+        # Check if dependencies are satisfied
+        deps_satisfied = all(phase_complete.get(dep, False) for dep in depends_on)
+        if not deps_satisfied:
+            continue
+
+        # Find first pending subtask in this phase
+        for subtask in phase.get("subtasks", []):
+            if subtask.get("status") == "pending":
+                return {
+                    "phase_id": phase_id,
+                    "phase_name": phase.get("name"),
+                    "phase_num": phase.get("phase"),
+                    **subtask,
+                }
 
-        # Find next available subtask
-        for phase in phases:
-            phase_id = phase.get("id") or phase.get("phase")
-            depends_on = phase.get("depends_on", [])
-
-            # Check if dependencies are satisfied
-            deps_satisfied = all(phase_complete.get(dep, False) for dep in depends_on)
-            if not deps_satisfied:
-                continue
-
-            # Find first pending subtask in this phase
-            for subtask in phase.get("subtasks", []):
-                if subtask.get("status") == "pending":
-                    return {
-                        "phase_id": phase_id,
-                        "phase_name": phase.get("name"),
-                        "phase_num": phase.get("phase"),
-                        **subtask,
-                    }
-
-        return None
-
-    except (OSError, json.JSONDecodeError):
-        return None
+    return None
 
 
 def format_duration(seconds: float) -> str:
@@ -8,12 +8,16 @@ Re-exports from core.progress for clean imports.
 from core.progress import (
     count_subtasks,
     count_subtasks_detailed,
+    count_subtasks_in_plan,
     format_duration,
     get_current_phase,
+    get_current_phase_in_plan,
     get_next_subtask,
+    get_next_subtask_in_plan,
     get_plan_summary,
     get_progress_percentage,
     is_build_complete,
+    is_build_complete_in_plan,
     print_build_complete_banner,
     print_paused_banner,
     print_progress_summary,
@@ -23,12 +27,16 @@ from core.progress import (
 __all__ = [
     "count_subtasks",
     "count_subtasks_detailed",
+    "count_subtasks_in_plan",
     "format_duration",
     "get_current_phase",
+    "get_current_phase_in_plan",
     "get_next_subtask",
+    "get_next_subtask_in_plan",
     "get_plan_summary",
     "get_progress_percentage",
     "is_build_complete",
+    "is_build_complete_in_plan",
     "print_build_complete_banner",
     "print_paused_banner",
     "print_progress_summary",
@@ -13,14 +13,20 @@ This approach:
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+from .prompts import _read_prompt_text
 
+
+@lru_cache(maxsize=16)
 def get_relative_spec_path(spec_dir: Path, project_dir: Path) -> str:
     """
     Get the spec directory path relative to the project/working directory.
 
     This ensures the AI gets a usable path regardless of absolute locations.
+    Results are cached, since the paths are fixed for a whole build.
 
     Args:
         spec_dir: Absolute path to spec directory
@@ -39,11 +45,13 @@ def get_relative_spec_path(spec_dir: Path, project_dir: Path) -> str:
         return f"./auto-claude/specs/{spec_dir.name}"
 
 
+@lru_cache(maxsize=16)
 def generate_environment_context(project_dir: Path, spec_dir: Path) -> str:
     """
     Generate environment context header for prompts.
 
     This explicitly tells the AI where it is working, preventing path confusion.
+    The header depends only on the two paths, so it is rendered once per pair.
 
     Args:
         project_dir: The working directory for the AI
@@ -73,6 +81,72 @@ relative to this location. Do NOT use absolute paths.
 """
 
 
+# Upper bound on threads used to read a subtask's context files
+_MAX_READ_WORKERS = 8
+
+# Static parts of the subtask prompt, filled in with str.format()
+_SUBTASK_HEADER_TMPL = """# Subtask Implementation Task
+
+**Subtask ID:** `{subtask_id}`
+**Phase:** {phase_name}
+**Service:** {service}
+
+## Description
+
+{description}
+"""
+
+_RETRY_TMPL = """
+## ⚠️ RETRY ATTEMPT ({attempt_number})
+
+This subtask has been attempted {attempt_count} time(s) before without success.
+You MUST use a DIFFERENT approach than previous attempts.
+"""
+
+_VERIFY_COMMAND_TMPL = """Run this command to verify:
+```bash
+{command}
+```
+Expected: {expected}
+"""
+
+_VERIFY_API_TMPL = """Test the API endpoint:
+```bash
+curl -X {method} {url} -H "Content-Type: application/json" {data_arg}
+```
+Expected status: {expected_status}
+"""
+
+_INSTRUCTIONS_TMPL = """## Instructions
+
+1. **Read the pattern files** to understand code style and conventions
+2. **Read the files to modify** (if any) to understand current implementation
+3. **Implement the subtask** following the patterns exactly
+4. **Run verification** and fix any issues
+5. **Commit your changes:**
+   ```bash
+   git add .
+   git commit -m "auto-claude: {subtask_id} - {short_description}"
+   ```
+6. **Update the plan** - set this subtask's status to "completed" in implementation_plan.json
+
+## Quality Checklist
+
+Before marking complete, verify:
+- [ ] Follows patterns from reference files
+- [ ] No console.log/print debugging statements
+- [ ] Error handling in place
+- [ ] Verification passes
+- [ ] Clean commit with descriptive message
+
+## Important
+
+- Focus ONLY on this subtask - don't modify unrelated code
+- If verification fails, FIX IT before committing
+- If you encounter a blocker, document it in build-progress.txt
+"""
+
+
 def generate_subtask_prompt(
     spec_dir: Path,
     project_dir: Path,
@@ -103,9 +177,6 @@ def generate_subtask_prompt(
     patterns_from = subtask.get("patterns_from", [])
     verification = subtask.get("verification", {})
 
-    # Get relative spec path
-    relative_spec = get_relative_spec_path(spec_dir, project_dir)
-
     # Build the prompt
     sections = []
 
@@ -113,29 +184,25 @@ def generate_subtask_prompt(
     sections.append(generate_environment_context(project_dir, spec_dir))
 
     # Header
-    sections.append(f"""# Subtask Implementation Task
-
-**Subtask ID:** `{subtask_id}`
-**Phase:** {phase.get("name", phase.get("id", "Unknown"))}
-**Service:** {service}
-
-## Description
-
-{description}
-""")
+    sections.append(
+        _SUBTASK_HEADER_TMPL.format(
+            subtask_id=subtask_id,
+            phase_name=phase.get("name", phase.get("id", "Unknown")),
+            service=service,
+            description=description,
+        )
+    )
 
     # Recovery context if this is a retry
     if attempt_count > 0:
-        sections.append(f"""
-## ⚠️ RETRY ATTEMPT ({attempt_count + 1})
-
-This subtask has been attempted {attempt_count} time(s) before without success.
-You MUST use a DIFFERENT approach than previous attempts.
-""")
+        sections.append(
+            _RETRY_TMPL.format(
+                attempt_number=attempt_count + 1, attempt_count=attempt_count
+            )
+        )
         if recovery_hints:
             sections.append("**Previous attempt insights:**")
-            for hint in recovery_hints:
-                sections.append(f"- {hint}")
+            sections.extend(f"- {hint}" for hint in recovery_hints)
             sections.append("")
 
     # Files section
@@ -143,20 +210,17 @@ You MUST use a DIFFERENT approach than previous attempts.
 
     if files_to_modify:
         sections.append("**Files to Modify:**")
-        for f in files_to_modify:
-            sections.append(f"- `{f}`")
+        sections.extend(f"- `{f}`" for f in files_to_modify)
         sections.append("")
 
     if files_to_create:
         sections.append("**Files to Create:**")
-        for f in files_to_create:
-            sections.append(f"- `{f}`")
+        sections.extend(f"- `{f}`" for f in files_to_create)
         sections.append("")
 
     if patterns_from:
         sections.append("**Pattern Files (study these first):**")
-        for f in patterns_from:
-            sections.append(f"- `{f}`")
+        sections.extend(f"- `{f}`" for f in patterns_from)
         sections.append("")
 
     # Verification
@@ -164,71 +228,49 @@ You MUST use a DIFFERENT approach than previous attempts.
     v_type = verification.get("type", "manual")
 
     if v_type == "command":
-        sections.append(f"""Run this command to verify:
-```bash
-{verification.get("command", 'echo "No command specified"')}
-```
-Expected: {verification.get("expected", "Success")}
-""")
+        sections.append(
+            _VERIFY_COMMAND_TMPL.format(
+                command=verification.get("command", 'echo "No command specified"'),
+                expected=verification.get("expected", "Success"),
+            )
+        )
     elif v_type == "api":
         method = verification.get("method", "GET")
         url = verification.get("url", "http://localhost")
         body = verification.get("body", {})
         expected_status = verification.get("expected_status", 200)
-        sections.append(f"""Test the API endpoint:
-```bash
-curl -X {method} {url} -H "Content-Type: application/json" {f"-d '{json.dumps(body)}'" if body else ""}
-```
-Expected status: {expected_status}
-""")
+        data_arg = f"-d '{json.dumps(body)}'" if body else ""
+        sections.append(
+            _VERIFY_API_TMPL.format(
+                method=method,
+                url=url,
+                data_arg=data_arg,
+                expected_status=expected_status,
+            )
+        )
     elif v_type == "browser":
         url = verification.get("url", "http://localhost:3000")
         checks = verification.get("checks", [])
         sections.append(f"""Open in browser: {url}
 
 Verify:""")
-        for check in checks:
-            sections.append(f"- [ ] {check}")
+        sections.extend(f"- [ ] {check}" for check in checks)
         sections.append("")
     elif v_type == "e2e":
         steps = verification.get("steps", [])
         sections.append("End-to-end verification steps:")
-        for i, step in enumerate(steps, 1):
-            sections.append(f"{i}. {step}")
+        sections.extend(f"{i}. {step}" for i, step in enumerate(steps, 1))
         sections.append("")
     else:
         instructions = verification.get("instructions", "Manual verification required")
         sections.append(f"**Manual Verification:**\n{instructions}\n")
 
     # Instructions
-    sections.append(f"""## Instructions
-
-1. **Read the pattern files** to understand code style and conventions
-2. **Read the files to modify** (if any) to understand current implementation
-3. **Implement the subtask** following the patterns exactly
-4. **Run verification** and fix any issues
-5. **Commit your changes:**
-   ```bash
-   git add .
-   git commit -m "auto-claude: {subtask_id} - {description[:50]}"
-   ```
-6. **Update the plan** - set this subtask's status to "completed" in implementation_plan.json
-
-## Quality Checklist
-
-Before marking complete, verify:
-- [ ] Follows patterns from reference files
-- [ ] No console.log/print debugging statements
-- [ ] Error handling in place
-- [ ] Verification passes
-- [ ] Clean commit with descriptive message
-
-## Important
-
-- Focus ONLY on this subtask - don't modify unrelated code
-- If verification fails, FIX IT before committing
-- If you encounter a blocker, document it in build-progress.txt
-""")
+    sections.append(
+        _INSTRUCTIONS_TMPL.format(
+            subtask_id=subtask_id, short_description=description[:50]
+        )
+    )
 
     # Note: Linear updates are now handled by Python orchestrator via linear_updater.py
     # Agents no longer need to call Linear MCP tools directly
@@ -253,7 +295,7 @@ def generate_planner_prompt(spec_dir: Path, project_dir: Path | None = None) ->
     planner_file = prompts_dir / "planner.md"
 
     if planner_file.exists():
-        prompt = planner_file.read_text()
+        prompt = _read_prompt_text(planner_file)
     else:
         prompt = (
             "Read spec.md and create implementation_plan.json with phases and subtasks."
@@ -292,6 +334,93 @@ not in the spec directory.
     return header + prompt
 
 
+@lru_cache(maxsize=1)
+def _read_executor() -> ThreadPoolExecutor:
+    """Shared pool for context file reads, created on first use."""
+    return ThreadPoolExecutor(
+        max_workers=_MAX_READ_WORKERS, thread_name_prefix="context-read"
+    )
+
+
+@lru_cache(maxsize=256)
+def _read_file_excerpt(path: str, mtime_ns: int, size: int, max_file_lines: int) -> str:
+    """
+    Read a file truncated to max_file_lines (keyed by mtime and size).
+
+    The newline scan and line count run on the raw bytes, and only the kept
+    prefix is decoded.
+    """
+    try:
+        data = Path(path).read_bytes()
+    except Exception:
+        return "(Could not read file)"
+    if b"\r" in data:
+        # Normalize line endings the way text mode would
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+    if max_file_lines <= 0:
+        cut, remaining = 0, data.count(b"\n") + 1
+    else:
+        cut = _nth_newline(data, max_file_lines)
+        # Lines after the cut: one per newline from the cut onwards
+        remaining = data.count(b"\n", cut) if cut != -1 else 0
+
+    try:
+        text = (data if cut == -1 else data[:cut]).decode("utf-8")
+    except UnicodeDecodeError:
+        return "(Could not read file)"
+    if cut == -1:
+        return text
+    return f"{text}\n\n... (truncated, {remaining} more lines)"
+
+
+def _nth_newline(data: bytes, n: int) -> int:
+    """
+    Find the index of the nth newline in data, or -1 if it has n lines or fewer.
+
+    Lets excerpts be sliced without splitting the whole file into lines.
+    """
+    pos = -1
+    for _ in range(n):
+        pos = data.find(b"\n", pos + 1)
+        if pos == -1:
+            return -1
+    return pos
+
+
+def _load_file_excerpts(
+    project_dir: Path, path_lists: tuple[list[str], ...], max_file_lines: int
+) -> list[dict[str, str]]:
+    """
+    Load truncated contents for each existing file, one dict per path list.
+
+    When several files are needed they are read on a shared thread pool, so
+    the wait is roughly the slowest read rather than the sum of all of them.
+    """
+    entries = []
+    for group, paths in enumerate(path_lists):
+        for rel_path in paths:
+            full_path = project_dir / rel_path
+            try:
+                st = full_path.stat()
+            except OSError:
+                continue
+            args = (str(full_path), st.st_mtime_ns, st.st_size, max_file_lines)
+            entries.append((group, rel_path, args))
+
+    if len(entries) > 1:
+        contents = list(
+            _read_executor().map(lambda entry: _read_file_excerpt(*entry[2]), entries)
+        )
+    else:
+        contents = [_read_file_excerpt(*args) for _, _, args in entries]
+
+    excerpts: list[dict[str, str]] = [{} for _ in path_lists]
+    for (group, rel_path, _), content in zip(entries, contents):
+        excerpts[group][rel_path] = content
+    return excerpts
+
+
 def load_subtask_context(
     spec_dir: Path,
     project_dir: Path,
@@ -301,6 +430,9 @@ def load_subtask_context(
     """
     Load minimal context needed for a subtask.
 
+    File excerpts are cached until the file changes, so retries of the same
+    subtask (and subtasks sharing pattern files) only re-read edited files.
+
     Args:
         spec_dir: Spec directory
         project_dir: Project root
@@ -310,48 +442,18 @@ def load_subtask_context(
     Returns:
         Dict with file contents and relevant context
     """
-    context = {
-        "patterns": {},
-        "files_to_modify": {},
+    # Pattern files and files to modify (truncated)
+    patterns, files_to_modify = _load_file_excerpts(
+        project_dir,
+        (subtask.get("patterns_from", []), subtask.get("files_to_modify", [])),
+        max_file_lines,
+    )
+    return {
+        "patterns": patterns,
+        "files_to_modify": files_to_modify,
         "spec_excerpt": None,
     }
 
-    # Load pattern files (truncated)
-    for pattern_path in subtask.get("patterns_from", []):
-        full_path = project_dir / pattern_path
-        if full_path.exists():
-            try:
-                lines = full_path.read_text().split("\n")
-                if len(lines) > max_file_lines:
-                    content = "\n".join(lines[:max_file_lines])
-                    content += (
-                        f"\n\n... (truncated, {len(lines) - max_file_lines} more lines)"
-                    )
-                else:
-                    content = "\n".join(lines)
-                context["patterns"][pattern_path] = content
-            except Exception:
-                context["patterns"][pattern_path] = "(Could not read file)"
-
-    # Load files to modify (truncated)
-    for file_path in subtask.get("files_to_modify", []):
-        full_path = project_dir / file_path
-        if full_path.exists():
-            try:
-                lines = full_path.read_text().split("\n")
-                if len(lines) > max_file_lines:
-                    content = "\n".join(lines[:max_file_lines])
-                    content += (
-                        f"\n\n... (truncated, {len(lines) - max_file_lines} more lines)"
-                    )
-                else:
-                    content = "\n".join(lines)
-                context["files_to_modify"][file_path] = content
-            except Exception:
-                context["files_to_modify"][file_path] = "(Could not read file)"
-
-    return context
-
 
 def format_context_for_prompt(context: dict) -> str:
     """
@@ -8,6 +8,7 @@ Supports dynamic prompt assembly based on project type for context optimization.
 
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 
 from .project_context import (
@@ -21,6 +22,18 @@ from .project_context import (
 PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
 
 
+@lru_cache(maxsize=64)
+def _read_cached(path: Path, mtime_ns: int, size: int) -> str:
+    """Read a text file (keyed by mtime and size so edits are picked up)."""
+    return path.read_text()
+
+
+def _read_prompt_text(prompt_file: Path) -> str:
+    """Read a prompt file, reusing the cached text while it is unchanged."""
+    st = prompt_file.stat()
+    return _read_cached(prompt_file, st.st_mtime_ns, st.st_size)
+
+
 def get_planner_prompt(spec_dir: Path) -> str:
     """
     Load the planner agent prompt with spec path injected.
@@ -40,7 +53,7 @@ def get_planner_prompt(spec_dir: Path) -> str:
             "Make sure the auto-claude/prompts/planner.md file exists."
         )
 
-    prompt = prompt_file.read_text()
+    prompt = _read_prompt_text(prompt_file)
 
     # Inject spec directory information at the beginning
     spec_context = f"""## SPEC LOCATION
@@ -83,7 +96,7 @@ def get_coding_prompt(spec_dir: Path) -> str:
             "Make sure the auto-claude/prompts/coder.md file exists."
         )
 
-    prompt = prompt_file.read_text()
+    prompt = _read_prompt_text(prompt_file)
 
     spec_context = f"""## SPEC LOCATION
 
@@ -104,12 +117,13 @@ The project root is the parent of auto-claude/. All code goes in the project roo
     if recovery_context:
         spec_context += recovery_context
 
-    # Check for human input file
-    human_input_file = spec_dir / "HUMAN_INPUT.md"
-    if human_input_file.exists():
-        human_input = human_input_file.read_text().strip()
-        if human_input:
-            spec_context += f"""## HUMAN INPUT (READ THIS FIRST!)
+    # Check for human input file (cached until it is edited)
+    try:
+        human_input = _read_prompt_text(spec_dir / "HUMAN_INPUT.md").strip()
+    except FileNotFoundError:
+        human_input = ""
+    if human_input:
+        spec_context += f"""## HUMAN INPUT (READ THIS FIRST!)
 
 The human has left you instructions. READ AND FOLLOW THESE CAREFULLY:
 
@@ -211,7 +225,7 @@ def get_followup_planner_prompt(spec_dir: Path) -> str:
             "Make sure the auto-claude/prompts/followup_planner.md file exists."
         )
 
-    prompt = prompt_file.read_text()
+    prompt = _read_prompt_text(prompt_file)
 
     # Inject spec directory information at the beginning
     spec_context = f"""## SPEC LOCATION (FOLLOW-UP MODE)
@@ -293,7 +307,7 @@ def _load_prompt_file(filename: str) -> str:
     prompt_file = PROMPTS_DIR / filename
     if not prompt_file.exists():
         raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
-    return prompt_file.read_text()
+    return _read_prompt_text(prompt_file)
 
 
 def get_qa_reviewer_prompt(spec_dir: Path, project_dir: Path) -> str:
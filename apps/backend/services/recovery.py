@@ -13,6 +13,7 @@ Key Features:
 - Escalation to human when stuck
 """
 
+import copy
 import json
 import subprocess
 from dataclasses import dataclass
@@ -66,6 +67,9 @@ class RecoveryManager:
         self.attempt_history_file = self.memory_dir / "attempt_history.json"
         self.build_commits_file = self.memory_dir / "build_commits.json"
 
+        # Parsed attempt history, keyed by the file's (mtime_ns, size)
+        self._history_cache: tuple[tuple[int, int], dict] | None = None
+
         # Ensure memory directory exists
         self.memory_dir.mkdir(parents=True, exist_ok=True)
 
@@ -102,21 +106,49 @@ class RecoveryManager:
         with open(self.build_commits_file, "w") as f:
             json.dump(initial_data, f, indent=2)
 
-    def _load_attempt_history(self) -> dict:
-        """Load attempt history from JSON file."""
+    def _history_stamp(self) -> tuple[int, int]:
+        st = self.attempt_history_file.stat()
+        return st.st_mtime_ns, st.st_size
+
+    def _read_attempt_history(self) -> dict:
+        """
+        Get the cached attempt history, read-only.
+
+        The parsed history is kept in memory and only re-read when the file
+        changes on disk, so repeated lookups within a session do no IO. The
+        returned dict is the cache itself: read accessors must hand out only
+        scalars or copies of what they return.
+        """
         try:
+            stamp = self._history_stamp()
+            if self._history_cache and self._history_cache[0] == stamp:
+                return self._history_cache[1]
             with open(self.attempt_history_file) as f:
-                return json.load(f)
+                data = json.load(f)
         except (OSError, json.JSONDecodeError):
             self._init_attempt_history()
             with open(self.attempt_history_file) as f:
-                return json.load(f)
+                data = json.load(f)
+            stamp = self._history_stamp()
+        self._history_cache = (stamp, data)
+        return data
+
+    def _load_attempt_history(self) -> dict:
+        """Load a private copy of the attempt history to modify and save."""
+        return copy.deepcopy(self._read_attempt_history())
 
     def _save_attempt_history(self, data: dict) -> None:
-        """Save attempt history to JSON file."""
+        """
+        Save attempt history to JSON file.
+
+        The saved dict becomes the cache, so callers must not modify it
+        afterwards.
+        """
         data["metadata"]["last_updated"] = datetime.now().isoformat()
-        with open(self.attempt_history_file, "w") as f:
-            json.dump(data, f, indent=2)
+        # Serialize in one call and write once (json.dump issues a write per
+        # encoded chunk)
+        self.attempt_history_file.write_text(json.dumps(data, indent=2))
+        self._history_cache = (self._history_stamp(), data)
 
     def _load_build_commits(self) -> dict:
         """Load build commits from JSON file."""
@@ -131,8 +163,7 @@ class RecoveryManager:
     def _save_build_commits(self, data: dict) -> None:
         """Save build commits to JSON file."""
         data["metadata"]["last_updated"] = datetime.now().isoformat()
-        with open(self.build_commits_file, "w") as f:
-            json.dump(data, f, indent=2)
+        self.build_commits_file.write_text(json.dumps(data, indent=2))
 
     def classify_failure(self, error: str, subtask_id: str) -> FailureType:
         """
@@ -193,7 +224,7 @@ class RecoveryManager:
         Returns:
             Number of attempts
         """
-        history = self._load_attempt_history()
+        history = self._read_attempt_history()
         subtask_data = history["subtasks"].get(subtask_id, {})
         return len(subtask_data.get("attempts", []))
 
@@ -204,7 +235,7 @@ class RecoveryManager:
         success: bool,
         approach: str,
         error: str | None = None,
-    ) -> None:
+    ) -> int:
         """
         Record an attempt at a subtask.
 
@@ -214,6 +245,9 @@ class RecoveryManager:
             success: Whether the attempt succeeded
             approach: Description of the approach taken
             error: Error message if failed
+
+        Returns:
+            Number of attempts at the subtask, including this one
         """
         history = self._load_attempt_history()
 
@@ -238,6 +272,7 @@ class RecoveryManager:
             history["subtasks"][subtask_id]["status"] = "failed"
 
         self._save_attempt_history(history)
+        return len(history["subtasks"][subtask_id]["attempts"])
 
     def is_circular_fix(self, subtask_id: str, current_approach: str) -> bool:
         """
@@ -250,7 +285,7 @@ class RecoveryManager:
         Returns:
             True if this appears to be a circular fix attempt
         """
-        history = self._load_attempt_history()
+        history = self._read_attempt_history()
         subtask_data = history["subtasks"].get(subtask_id, {})
         attempts = subtask_data.get("attempts", [])
 
@@ -446,19 +481,17 @@ class RecoveryManager:
             reason: Why it's stuck
         """
         history = self._load_attempt_history()
+        subtask_data = history["subtasks"].get(subtask_id, {})
 
         stuck_entry = {
             "subtask_id": subtask_id,
             "reason": reason,
             "escalated_at": datetime.now().isoformat(),
-            "attempt_count": self.get_attempt_count(subtask_id),
+            "attempt_count": len(subtask_data.get("attempts", [])),
         }
 
         # Check if already in stuck list
-        existing = [
-            s for s in history["stuck_subtasks"] if s["subtask_id"] == subtask_id
-        ]
-        if not existing:
+        if not any(s["subtask_id"] == subtask_id for s in history["stuck_subtasks"]):
             history["stuck_subtasks"].append(stuck_entry)
 
         # Update subtask status
@@ -474,8 +507,8 @@ class RecoveryManager:
         Returns:
             List of stuck subtask entries
         """
-        history = self._load_attempt_history()
-        return history.get("stuck_subtasks", [])
+        history = self._read_attempt_history()
+        return [dict(entry) for entry in history.get("stuck_subtasks", [])]
 
     def get_subtask_history(self, subtask_id: str) -> dict:
         """
@@ -487,10 +520,11 @@ class RecoveryManager:
         Returns:
             Subtask history dict with attempts
         """
-        history = self._load_attempt_history()
-        return history["subtasks"].get(
-            subtask_id, {"attempts": [], "status": "pending"}
-        )
+        history = self._read_attempt_history()
+        subtask_data = history["subtasks"].get(subtask_id)
+        if subtask_data is None:
+            return {"attempts": [], "status": "pending"}
+        return copy.deepcopy(subtask_data)
 
     def get_recovery_hints(self, subtask_id: str) -> list[str]:
         """
@@ -502,8 +536,8 @@ class RecoveryManager:
         Returns:
             List of hint strings
         """
-        subtask_history = self.get_subtask_history(subtask_id)
-        attempts = subtask_history.get("attempts", [])
+        history = self._read_attempt_history()
+        attempts = history["subtasks"].get(subtask_id, {}).get("attempts", [])
 
         if not attempts:
             return ["This is the first attempt at this subtask"]
@@ -6,10 +6,38 @@ Functions for drawing boxes and dividers in terminal output.
 """
 
 import re
+from functools import lru_cache
 
 from .capabilities import FANCY_UI
 from .icons import Icons, icon
 
+# ANSI escape sequences, stripped when measuring visible width
+_ANSI_RE = re.compile(r"\033\[[0-9;]*m")
+
+
+@lru_cache(maxsize=2)
+def _box_chars(style: str) -> tuple[str, str, str, str, str, str]:
+    """Resolve the (tl, tr, bl, br, h, v) border characters for a style."""
+    if style == "heavy":
+        chars = (
+            Icons.BOX_TL,
+            Icons.BOX_TR,
+            Icons.BOX_BL,
+            Icons.BOX_BR,
+            Icons.BOX_H,
+            Icons.BOX_V,
+        )
+    else:
+        chars = (
+            Icons.BOX_TL_LIGHT,
+            Icons.BOX_TR_LIGHT,
+            Icons.BOX_BL_LIGHT,
+            Icons.BOX_BR_LIGHT,
+            Icons.BOX_H_LIGHT,
+            Icons.BOX_V_LIGHT,
+        )
+    return tuple(icon(c) for c in chars)
+
 
 def box(
     content: str | list[str],
@@ -45,28 +73,12 @@ def box(
             lines.append(separator)
         for line in content:
             # Strip ANSI codes for plain output
-            plain_line = re.sub(r"\033\[[0-9;]*m", "", line)
+            plain_line = _ANSI_RE.sub("", line)
             lines.append(f"  {plain_line}")
         lines.append(separator)
         return "\n".join(lines)
 
-    if style == "heavy":
-        tl, tr, bl, br = Icons.BOX_TL, Icons.BOX_TR, Icons.BOX_BL, Icons.BOX_BR
-        h, v = Icons.BOX_H, Icons.BOX_V
-        ml, mr = Icons.BOX_ML, Icons.BOX_MR
-    else:
-        tl, tr, bl, br = (
-            Icons.BOX_TL_LIGHT,
-            Icons.BOX_TR_LIGHT,
-            Icons.BOX_BL_LIGHT,
-            Icons.BOX_BR_LIGHT,
-        )
-        h, v = Icons.BOX_H_LIGHT, Icons.BOX_V_LIGHT
-        ml, mr = Icons.BOX_ML_LIGHT, Icons.BOX_MR_LIGHT
-
-    tl, tr, bl, br = icon(tl), icon(tr), icon(bl), icon(br)
-    h, v = icon(h), icon(v)
-    ml, mr = icon(ml), icon(mr)
+    tl, tr, bl, br, h, v = _box_chars(style)
 
     inner_width = width - 2  # Account for side borders
     lines = []
@@ -74,7 +86,7 @@ def box(
     # Top border with optional title
     if title:
         # Calculate visible length (strip ANSI codes for length calculation)
-        visible_title = re.sub(r"\033\[[0-9;]*m", "", title)
+        visible_title = _ANSI_RE.sub("", title)
         title_len = len(visible_title)
         padding = inner_width - title_len - 2  # -2 for spaces around title
 
@@ -94,7 +106,7 @@ def box(
     # Content lines
     for line in content:
         # Strip ANSI for length calculation
-        visible_line = re.sub(r"\033\[[0-9;]*m", "", line)
+        visible_line = _ANSI_RE.sub("", line)
         padding = inner_width - len(visible_line) - 2  # -2 for padding spaces
         if padding < 0:
             # Truncate if too long
@@ -5,11 +5,19 @@ Progress Indicators
 Progress bar and related progress display utilities.
 """
 
+from functools import lru_cache
+
 from .capabilities import COLOR
 from .colors import info, muted, success, warning
 from .icons import Icons, icon
 
 
+@lru_cache(maxsize=8)
+def _bar_strips(width: int) -> tuple[str, str]:
+    """Get full-width filled and empty bar strings to slice bars from."""
+    return icon(Icons.BAR_FULL) * width, icon(Icons.BAR_EMPTY) * width
+
+
 def progress_bar(
     current: int,
     total: int,
@@ -37,12 +45,10 @@ def progress_bar(
         filled = 0
     else:
         percent = current / total
-        filled = int(width * percent)
-
-    full = icon(Icons.BAR_FULL)
-    empty = icon(Icons.BAR_EMPTY)
+        filled = min(max(int(width * percent), 0), width)
 
-    bar = full * filled + empty * (width - filled)
+    full, empty = _bar_strips(width)
+    bar = full[:filled] + empty[filled:]
 
     # Apply color based on progress
     if color_gradient and COLOR:
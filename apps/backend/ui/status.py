@@ -7,6 +7,8 @@ Build status tracking and status file management for ccstatusline integration.
 
 import json
 import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -115,6 +117,7 @@ class StatusManager:
         self._write_pending = False
         self._write_timer: threading.Timer | None = None
         self._write_lock = threading.Lock()  # Protects _write_pending and _write_timer
+        self._batch_depth = 0  # Writes are deferred while > 0 (see batch())
 
     def read(self) -> BuildStatus:
         """Read current status from file."""
@@ -138,8 +141,12 @@ class StatusManager:
         write_start = time.time()
 
         with self._write_lock:
-            self._write_pending = False
             self._write_timer = None
+            # Never write a half-applied batch; batch() writes when it exits
+            if self._batch_depth:
+                self._write_pending = True
+                return
+            self._write_pending = False
             # Update timestamp inside lock to prevent race conditions
             self._status.last_update = datetime.now().isoformat()
             # Capture consistent snapshot while holding lock
@@ -193,6 +200,10 @@ class StatusManager:
         with self._write_lock:
             if status:
                 self._status = status
+            # Inside batch(), just note the write; it happens when the batch ends
+            if self._batch_depth:
+                self._write_pending = True
+                return
 
         if immediate:
             # Cancel any pending debounced write
@@ -214,6 +225,33 @@ class StatusManager:
         if should_write:
             self._do_write()
 
+    @contextmanager
+    def batch(self) -> Iterator["StatusManager"]:
+        """Group several updates into a single status file write.
+
+        Updates made inside the block only change the in-memory status; one
+        write is scheduled when the outermost batch exits.
+
+        Example:
+            with status_manager.batch():
+                status_manager.update_session(3)
+                status_manager.update_subtasks(in_progress=1)
+        """
+        with self._write_lock:
+            self._batch_depth += 1
+            # A debounced write scheduled before the batch joins it instead
+            if self._write_timer is not None:
+                self._write_timer.cancel()
+                self._write_timer = None
+        try:
+            yield self
+        finally:
+            with self._write_lock:
+                self._batch_depth -= 1
+                should_write = not self._batch_depth and self._write_pending
+            if should_write:
+                self._schedule_write()
+
     def update(self, **kwargs) -> None:
         """Update specific status fields."""
         with self._write_lock:
@@ -42,8 +42,12 @@ if 'claude_code_sdk' not in sys.modules:
     sys.modules['claude_code_sdk'] = _create_sdk_mock()
     sys.modules['claude_code_sdk.types'] = MagicMock()
 
-# Add apps/backend directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+# Add apps/backend directory to path for imports. The path is resolved once and
+# only inserted if missing, so re-imports don't grow sys.path and every lookup
+# shares one path-importer cache entry.
+_BACKEND_DIR = str((Path(__file__).parent.parent / "apps" / "backend").resolve())
+if _BACKEND_DIR not in sys.path:
+    sys.path.insert(0, _BACKEND_DIR)
 
 
 # =============================================================================
@@ -156,6 +160,30 @@ def pytest_runtest_setup(item):
                     pass
 
 
+# =============================================================================
+# SESSION SETUP
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def precompiled_backend() -> str:
+    """
+    Compile backend bytecode once, in parallel, for tests that need it.
+
+    Cold-interpreter checks in subprocesses then load from __pycache__
+    instead of compiling each module on first use. Modules with up-to-date
+    bytecode are only stat'ed. Nothing is written when bytecode writing is
+    disabled (-B or PYTHONDONTWRITEBYTECODE).
+
+    Returns:
+        The backend directory
+    """
+    if not sys.dont_write_bytecode:
+        import compileall
+
+        compileall.compile_dir(_BACKEND_DIR, quiet=1, workers=0)
+    return _BACKEND_DIR
+
+
 # =============================================================================
 # DIRECTORY FIXTURES
 # =============================================================================
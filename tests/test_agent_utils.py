@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Tests for Agent Utility Functions
+=================================
+
+Tests the git and plan helpers in agents/utils.py used by the coder loop
+and post-session processing.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from agents import utils
+from core import plan_io
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+class TestGetGitSnapshot:
+    """Tests for get_git_snapshot."""
+
+    def test_matches_git(self, temp_git_repo, make_commit):
+        """Hash and count agree with rev-parse and rev-list."""
+        make_commit("a.txt", "a", "Add a")
+        assert utils.get_git_snapshot(temp_git_repo) == (
+            _git(temp_git_repo, "rev-parse", "HEAD"),
+            int(_git(temp_git_repo, "rev-list", "--count", "HEAD")),
+        )
+
+    def test_packed_refs(self, temp_git_repo):
+        """Branch refs stored only in packed-refs are resolved."""
+        _git(temp_git_repo, "pack-refs", "--all")
+        commit, _ = utils.get_git_snapshot(temp_git_repo)
+        assert commit == _git(temp_git_repo, "rev-parse", "HEAD")
+
+    def test_detached_head(self, temp_git_repo, make_commit):
+        """A detached HEAD resolves to its commit."""
+        first = _git(temp_git_repo, "rev-parse", "HEAD")
+        make_commit("a.txt", "a", "Add a")
+        _git(temp_git_repo, "checkout", "-q", first)
+        assert utils.get_git_snapshot(temp_git_repo) == (first, 1)
+
+    def test_linked_worktree(self, temp_git_repo, make_commit, temp_dir):
+        """A linked worktree resolves its own branch through commondir."""
+        worktree = temp_dir / "worktree"
+        _git(temp_git_repo, "worktree", "add", "-q", "-b", "feature", str(worktree))
+        make_commit("a.txt", "a", "Add a")
+        commit, count = utils.get_git_snapshot(worktree)
+        assert commit == _git(worktree, "rev-parse", "HEAD")
+        assert commit != _git(temp_git_repo, "rev-parse", "HEAD")
+        assert count == 1
+
+    def test_not_a_repo(self, temp_dir):
+        """Directories outside git report no commit."""
+        assert utils.get_git_snapshot(temp_dir) == (None, 0)
+
+    def test_previous_snapshot_reused(self, temp_git_repo, make_commit, monkeypatch):
+        """An unchanged HEAD reuses the previous count without running git."""
+        before = utils.get_git_snapshot(temp_git_repo)
+        calls = []
+        real_count = utils.get_commit_count
+        monkeypatch.setattr(
+            utils,
+            "get_commit_count",
+            lambda d: calls.append(d) or real_count(d),
+        )
+        assert utils.get_git_snapshot(temp_git_repo, previous=before) == before
+        assert calls == []
+
+        make_commit("a.txt", "a", "Add a")
+        commit, count = utils.get_git_snapshot(temp_git_repo, previous=before)
+        assert (commit, count) == (_git(temp_git_repo, "rev-parse", "HEAD"), 2)
+        assert len(calls) == 1
+
+
+class TestGitSession:
+    """Tests for the long-lived GitSession helper."""
+
+    def test_tracks_new_commits(self, temp_git_repo, make_commit):
+        """Snapshots follow HEAD as commits are made."""
+        with utils.GitSession(temp_git_repo) as session:
+            assert session.snapshot() == (_git(temp_git_repo, "rev-parse", "HEAD"), 1)
+            head = make_commit("a.txt", "a", "Add a")
+            make_commit("b.txt", "b", "Add b")
+            assert session.snapshot() == (_git(temp_git_repo, "rev-parse", "HEAD"), 3)
+            assert head != session.head_sha()
+
+    def test_handles_rewritten_history(self, temp_git_repo, make_commit):
+        """Amends and resets keep the count exact."""
+        with utils.GitSession(temp_git_repo) as session:
+            make_commit("a.txt", "a", "Add a")
+            assert session.snapshot()[1] == 2
+
+            _git(temp_git_repo, "commit", "-q", "--amend", "-m", "Amended")
+            assert session.snapshot() == (_git(temp_git_repo, "rev-parse", "HEAD"), 2)
+
+            _git(temp_git_repo, "reset", "-q", "--hard", "HEAD~1")
+            assert session.snapshot() == (_git(temp_git_repo, "rev-parse", "HEAD"), 1)
+
+    def test_not_a_repo(self, temp_dir):
+        """Directories outside git report no commit."""
+        with utils.GitSession(temp_dir) as session:
+            assert session.snapshot() == (None, 0)
+
+    def test_close_stops_process(self, temp_git_repo):
+        """close() shuts the helper process down."""
+        session = utils.GitSession(temp_git_repo)
+        session.head_sha()
+        proc = session._proc
+        session.close()
+        assert proc.poll() is not None
+
+
+class TestLoadImplementationPlan:
+    """Tests for the cached load_implementation_plan."""
+
+    def _write_plan(self, spec_dir: Path, plan: dict, mtime_ns: int) -> None:
+        plan_file = spec_dir / "implementation_plan.json"
+        plan_file.write_text(json.dumps(plan))
+        os.utime(plan_file, ns=(mtime_ns, mtime_ns))
+
+    def test_missing_plan(self, spec_dir):
+        """Returns None without a plan file."""
+        assert utils.load_implementation_plan(spec_dir) is None
+
+    def test_invalid_json(self, spec_dir):
+        """Returns None for unparseable plans."""
+        (spec_dir / "implementation_plan.json").write_text("{not json")
+        assert utils.load_implementation_plan(spec_dir) is None
+
+    def test_invalid_utf8(self, spec_dir):
+        """Returns None for plans that aren't valid UTF-8."""
+        (spec_dir / "implementation_plan.json").write_bytes(b'{"name": "\xff"}')
+        assert utils.load_implementation_plan(spec_dir) is None
+
+    def test_stdlib_fallback(self, spec_dir, monkeypatch):
+        """Plans parse the same without orjson."""
+        monkeypatch.setattr(plan_io, "_json_loads", json.loads)
+        self._write_plan(spec_dir, {"phases": [{"id": "p1"}]}, 1_000_000_000)
+        assert utils.load_implementation_plan(spec_dir) == {"phases": [{"id": "p1"}]}
+
+    def test_cached_until_modified(self, spec_dir):
+        """Unchanged plans are served from cache; modified plans are reloaded."""
+        self._write_plan(spec_dir, {"phases": []}, 1_000_000_000)
+        first = utils.load_implementation_plan(spec_dir)
+        assert utils.load_implementation_plan(spec_dir) is first
+
+        self._write_plan(spec_dir, {"phases": [{"id": "p1"}]}, 2_000_000_000)
+        assert utils.load_implementation_plan(spec_dir) == {"phases": [{"id": "p1"}]}
+
+    def test_invalidate(self, spec_dir):
+        """invalidate_plan_cache forces a reload."""
+        self._write_plan(spec_dir, {"phases": []}, 1_000_000_000)
+        first = utils.load_implementation_plan(spec_dir)
+        utils.invalidate_plan_cache(spec_dir)
+        second = utils.load_implementation_plan(spec_dir)
+        assert second == first
+        assert second is not first
+
+
+class TestFindSubtask:
+    """Tests for find_subtask_in_plan and find_phase_for_subtask."""
+
+    PLAN = {
+        "phases": [
+            {"id": "p1", "subtasks": [{"id": "s1"}, {"id": "s2"}]},
+            {"id": "p2", "subtasks": [{"id": "s3"}]},
+        ]
+    }
+
+    def test_plain_plan(self):
+        """Plans not loaded through the cache are scanned directly."""
+        plan = json.loads(json.dumps(self.PLAN))
+        assert utils.find_subtask_in_plan(plan, "s3") == {"id": "s3"}
+        assert utils.find_phase_for_subtask(plan, "s3")["id"] == "p2"
+        assert utils.find_subtask_in_plan(plan, "missing") is None
+        assert utils.find_phase_for_subtask(plan, "missing") is None
+
+        # Mutations of caller-owned plans are always seen
+        plan["phases"][0]["subtasks"].append({"id": "s4"})
+        assert utils.find_phase_for_subtask(plan, "s4")["id"] == "p1"
+
+    def test_cached_plan(self, spec_dir):
+        """Plans from load_implementation_plan are looked up via the index."""
+        (spec_dir / "implementation_plan.json").write_text(json.dumps(self.PLAN))
+        plan = utils.load_implementation_plan(spec_dir)
+        subtask = utils.find_subtask_in_plan(plan, "s2")
+        assert subtask is plan["phases"][0]["subtasks"][1]
+        assert utils.find_phase_for_subtask(plan, "s2") is plan["phases"][0]
+        assert utils.find_subtask_in_plan(plan, "missing") is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for Client Configuration Helpers
+======================================
+
+Tests the project-level configuration loading in core/client.py.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from core import client
+
+
+class TestLoadProjectMcpConfig:
+    """Tests for load_project_mcp_config."""
+
+    def _write_env(self, project_dir: Path, text: str, mtime_ns: int) -> None:
+        env_file = project_dir / ".auto-claude" / ".env"
+        env_file.parent.mkdir(exist_ok=True)
+        env_file.write_text(text)
+        os.utime(env_file, ns=(mtime_ns, mtime_ns))
+
+    def test_missing_env(self, temp_dir):
+        """Projects without a .env file have no MCP config."""
+        assert client.load_project_mcp_config(temp_dir) == {}
+
+    def test_parses_mcp_keys(self, temp_dir):
+        """Only MCP-related keys are returned."""
+        self._write_env(
+            temp_dir,
+            "# comment\nCONTEXT7_ENABLED=false\nAGENT_MCP_coder_ADD=x\nOTHER=1\n",
+            1_000_000_000,
+        )
+        assert client.load_project_mcp_config(temp_dir) == {
+            "CONTEXT7_ENABLED": "false",
+            "AGENT_MCP_coder_ADD": "x",
+        }
+
+    def test_cached_until_modified(self, temp_dir):
+        """The file is re-parsed only after it changes."""
+        self._write_env(temp_dir, "CONTEXT7_ENABLED=false\n", 1_000_000_000)
+        config = client.load_project_mcp_config(temp_dir)
+        config["CONTEXT7_ENABLED"] = "mutated"
+        assert client.load_project_mcp_config(temp_dir) == {"CONTEXT7_ENABLED": "false"}
+
+        self._write_env(temp_dir, "CONTEXT7_ENABLED=true\n", 2_000_000_000)
+        assert client.load_project_mcp_config(temp_dir) == {"CONTEXT7_ENABLED": "true"}
+
+
+class TestWriteSettingsFile:
+    """Tests for _write_settings_file."""
+
+    def test_skips_unchanged(self, temp_dir):
+        """The file is only rewritten when its content changes."""
+        settings_file = temp_dir / ".claude_settings.json"
+        settings = {"sandbox": {"enabled": True}}
+
+        assert client._write_settings_file(settings_file, settings) is True
+        assert json.loads(settings_file.read_text()) == settings
+        assert client._write_settings_file(settings_file, settings) is False
+
+        settings["sandbox"]["enabled"] = False
+        assert client._write_settings_file(settings_file, settings) is True
+        assert json.loads(settings_file.read_text()) == settings
+
+    def test_compact_unless_pretty(self, temp_dir):
+        """Settings are compact by default and indented when pretty."""
+        settings_file = temp_dir / ".claude_settings.json"
+        settings = {"sandbox": {"enabled": True}}
+
+        client._write_settings_file(settings_file, settings)
+        assert settings_file.read_text() == '{"sandbox":{"enabled":true}}'
+
+        assert client._write_settings_file(settings_file, settings, pretty=True)
+        assert settings_file.read_text() == json.dumps(settings, indent=2)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
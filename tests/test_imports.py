@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Tests for Module Imports
+========================
+
+Smoke-tests that the backend facades and core modules can be found, and (as
+slow tests) that they import and expose their public callables, both in this
+process and in a fresh interpreter. The backend directory is put on sys.path
+by conftest.
+
+The import checks are grouped by top-level package, so with pytest-xdist
+(``pytest -n 4 --dist=loadgroup tests/test_imports.py``) each worker imports
+one cluster instead of one process importing everything.
+"""
+
+import importlib
+import importlib.metadata
+import importlib.util
+import inspect
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Resolved once; subprocesses and sys.path want a plain string
+BACKEND_DIR = os.fspath(Path(__file__).resolve().parent.parent / "apps" / "backend")
+
+# Public callables each module must expose, by module
+NAMES_BY_MODULE = {
+    "progress": (
+        "count_subtasks",
+        "get_next_subtask",
+        "get_next_subtask_in_plan",
+        "is_build_complete",
+        "print_progress_summary",
+    ),
+    "client": ("create_client",),
+    "core.client": ("create_client", "load_project_mcp_config"),
+    "core.plan_io": ("load_implementation_plan", "invalidate_plan_cache"),
+    "agents.utils": (
+        "get_git_snapshot",
+        "load_implementation_plan",
+        "find_phase_for_subtask",
+    ),
+    "prompts_pkg": (
+        "generate_subtask_prompt",
+        "get_coding_prompt",
+        "load_subtask_context",
+    ),
+    "recovery": ("RecoveryManager", "check_and_recover"),
+    "security": ("bash_security_hook", "validate_command"),
+    "qa_loop": ("run_qa_validation_loop", "should_run_qa"),
+}
+
+# Modules that import the agent SDK at load time
+SDK_MODULES = frozenset({"qa_loop"})
+
+# Modules that only need to be locatable; importing them pulls in the agent
+# runtime, so the fast check uses find_spec instead
+AGENT_MODULES = ("agents.coder", "agents.planner", "agents.session", "core.auth")
+
+# Opt-in upper bound, in milliseconds, on the summed self time of a cold
+# `import progress` (e.g. AUTO_CLAUDE_IMPORT_BUDGET=200). Wall-clock timings
+# vary too much on shared CI runners to check by default.
+PROGRESS_IMPORT_BUDGET_MS = os.environ.get("AUTO_CLAUDE_IMPORT_BUDGET")
+
+# Heavy or optional third-party packages `import progress` must not load
+HEAVY_DEPS = frozenset(
+    {
+        "anthropic",
+        "claude_agent_sdk",
+        "graphiti_core",
+        "numpy",
+        "openai",
+        "pandas",
+        "requests",
+        "torch",
+    }
+)
+
+# Names the progress facade must list in __all__
+_REQUIRED_PROGRESS_EXPORTS = frozenset(
+    {
+        "count_subtasks",
+        "count_subtasks_in_plan",
+        "get_current_phase_in_plan",
+        "get_next_subtask_in_plan",
+        "get_plan_summary",
+        "is_build_complete_in_plan",
+        "print_progress_summary",
+    }
+)
+
+
+def _import_group(module_name: str) -> pytest.MarkDecorator:
+    """xdist group for a module: its top-level package."""
+    return pytest.mark.xdist_group(name=module_name.partition(".")[0])
+
+
+def _sdk_installed() -> bool:
+    """Whether the agent SDK is really installed (conftest may mock it)."""
+    try:
+        importlib.metadata.distribution("claude-agent-sdk")
+    except importlib.metadata.PackageNotFoundError:
+        return False
+    return True
+
+
+@pytest.fixture(scope="session")
+def cold_import(precompiled_backend):
+    """
+    Runner for statements in a fresh isolated interpreter.
+
+    Unlike in-process imports, this catches import errors hidden by modules
+    already in sys.modules. Backend bytecode is compiled once for the session
+    (see conftest), so the subprocesses measure importing rather than
+    compiling.
+    """
+    path_setup = f"import sys; sys.path.insert(0, {BACKEND_DIR!r}); "
+
+    def run(statement: str, *options: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, "-I", "-B", *options, "-c", path_setup + statement],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+
+    return run
+
+
+@pytest.mark.parametrize("module_name", [*NAMES_BY_MODULE, *AGENT_MODULES])
+def test_module_findable(module_name):
+    """Each module can be located without executing it."""
+    assert importlib.util.find_spec(module_name) is not None
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "module_name,name",
+    [
+        pytest.param(m, n, id=f"{m}.{n}", marks=_import_group(m))
+        for m, names in NAMES_BY_MODULE.items()
+        for n in names
+    ],
+)
+def test_export(module_name, name):
+    """Each module defines the expected callable itself."""
+    # getattr_static skips a module-level __getattr__ (PEP 562), so names only
+    # reachable through a lazy fallback don't count as exported
+    assert callable(inspect.getattr_static(importlib.import_module(module_name), name))
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "module_name,names",
+    [
+        pytest.param(m, names, id=m, marks=_import_group(m))
+        for m, names in NAMES_BY_MODULE.items()
+    ],
+)
+def test_public_callables_cold_import(cold_import, module_name, names):
+    """Each module imports from a cold interpreter."""
+    if module_name in SDK_MODULES and not _sdk_installed():
+        pytest.skip("claude-agent-sdk is not installed")
+    result = cold_import(
+        f"import {module_name}; "
+        f"assert all(callable(getattr({module_name}, n)) for n in {names!r})"
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def _parse_importtime(stderr: str) -> list[tuple[int, str]]:
+    """Parse `-X importtime` output into (self time in us, module) pairs."""
+    timings = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, module = line[len("import time:") :].split("|", 2)
+        timings.append((int(self_us), module.strip()))
+    return timings
+
+
+@pytest.mark.slow
+@_import_group("progress")
+@pytest.mark.skipif(
+    not PROGRESS_IMPORT_BUDGET_MS, reason="AUTO_CLAUDE_IMPORT_BUDGET is not set"
+)
+def test_progress_cold_import_under_budget(cold_import):
+    """A cold `import progress` stays within its import-time budget."""
+    result = cold_import("import progress", "-X", "importtime")
+    assert result.returncode == 0, result.stderr
+
+    timings = _parse_importtime(result.stderr)
+    total_us = sum(self_us for self_us, _ in timings)
+    top = ", ".join(f"{name} ({us} us)" for us, name in sorted(timings)[-5:][::-1])
+    budget_us = int(PROGRESS_IMPORT_BUDGET_MS) * 1000
+    assert total_us < budget_us, f"import progress took {total_us} us; slowest: {top}"
+
+
+@pytest.mark.slow
+@_import_group("progress")
+def test_progress_does_not_load_heavy_deps(cold_import):
+    """A cold `import progress` loads none of the heavy optional packages."""
+    result = cold_import(
+        "import json; before = set(sys.modules); import progress; "
+        "print(json.dumps(sorted(set(sys.modules) - before)))"
+    )
+    assert result.returncode == 0, result.stderr
+
+    loaded = {name.partition(".")[0] for name in json.loads(result.stdout)}
+    leaked = HEAVY_DEPS & loaded
+    assert not leaked, f"import progress loaded {sorted(leaked)}"
+
+
+@_import_group("progress")
+def test_progress_facade_exports():
+    """The progress facade re-exports the plan helpers in __all__."""
+    progress = importlib.import_module("progress")
+    missing = _REQUIRED_PROGRESS_EXPORTS.difference(progress.__all__)
+    assert not missing, f"progress.__all__ is missing {sorted(missing)}"
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-v"]))
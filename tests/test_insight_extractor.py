@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Tests for Insight Extractor Git Helpers
+=======================================
+
+Tests the git helpers in analysis/insight_extractor.py that gather the
+session diff, changed files, and commit messages for insight extraction.
+Each helper is exercised with both the pygit2 backend (when installed)
+and the subprocess git fallback.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from analysis import insight_extractor
+from core import plan_io
+
+
+@pytest.fixture(
+    params=[
+        pytest.param(True, id="pygit2"),
+        pytest.param(False, id="subprocess"),
+    ]
+)
+def git_backend(request, monkeypatch):
+    """Run a test against each available git backend."""
+    use_pygit2 = request.param
+    if use_pygit2 and not insight_extractor.PYGIT2_AVAILABLE:
+        pytest.skip("pygit2 not installed")
+    monkeypatch.setattr(insight_extractor, "USE_PYGIT2", use_pygit2)
+    monkeypatch.setattr(insight_extractor, "_REPO_CACHE", {})
+    return use_pygit2
+
+
+@pytest.fixture
+def session_commits(temp_git_repo: Path, make_commit):
+    """Create two commits on top of the initial commit."""
+    before = subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=temp_git_repo,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+    make_commit("src/app.py", "print('hello')\n", "Add app")
+    after = make_commit("src/util.py", "VALUE = 1\n", "Add util")
+    return temp_git_repo, before, after
+
+
+class TestGetSessionDiff:
+    """Tests for get_session_diff."""
+
+    def test_missing_commits(self, temp_git_repo, git_backend):
+        """Returns a placeholder when a commit is missing."""
+        diff = insight_extractor.get_session_diff(temp_git_repo, None, "abc")
+        assert diff == "(No commits to diff)"
+
+    def test_same_commit(self, temp_git_repo, git_backend):
+        """Returns a placeholder when before and after are identical."""
+        diff = insight_extractor.get_session_diff(temp_git_repo, "abc", "abc")
+        assert diff == "(No changes - same commit)"
+
+    def test_diff_contains_changes(self, session_commits, git_backend):
+        """Diff includes every file changed between the commits."""
+        project_dir, before, after = session_commits
+        diff = insight_extractor.get_session_diff(project_dir, before, after)
+        assert "src/app.py" in diff
+        assert "src/util.py" in diff
+        assert "+VALUE = 1" in diff
+
+    def test_diff_is_truncated(self, session_commits, git_backend, monkeypatch):
+        """Large diffs are truncated to MAX_DIFF_CHARS."""
+        project_dir, before, after = session_commits
+        monkeypatch.setattr(insight_extractor, "MAX_DIFF_CHARS", 50)
+        diff = insight_extractor.get_session_diff(project_dir, before, after)
+        assert "... (truncated," in diff
+
+
+class TestReadDiffOutput:
+    """Tests for _read_diff_output."""
+
+    def test_truncates_on_utf8_boundary(self, temp_dir):
+        """A multi-byte character cut by the limit is dropped, not garbled."""
+        text, truncated = insight_extractor._read_diff_output(
+            [
+                sys.executable,
+                "-c",
+                "import sys; sys.stdout.buffer.write('aé!'.encode())",
+            ],
+            temp_dir,
+            limit=2,
+            timeout=10,
+        )
+        assert (text, truncated) == ("a", True)
+
+    def test_short_output(self, temp_dir):
+        """Output within the limit is returned whole."""
+        text, truncated = insight_extractor._read_diff_output(
+            [sys.executable, "-c", "print('é')"], temp_dir, limit=100, timeout=10
+        )
+        assert (text.strip(), truncated) == ("é", False)
+
+
+class TestGetChangedFiles:
+    """Tests for get_changed_files."""
+
+    def test_same_commit(self, temp_git_repo, git_backend):
+        """No files changed for identical commits."""
+        assert insight_extractor.get_changed_files(temp_git_repo, "a", "a") == []
+
+    def test_lists_changed_files(self, session_commits, git_backend):
+        """Lists files changed between the commits."""
+        project_dir, before, after = session_commits
+        files = insight_extractor.get_changed_files(project_dir, before, after)
+        assert sorted(files) == ["src/app.py", "src/util.py"]
+
+
+class TestGetCommitMessages:
+    """Tests for get_commit_messages."""
+
+    def test_same_commit(self, temp_git_repo, git_backend):
+        """No commits for identical commits."""
+        assert insight_extractor.get_commit_messages(temp_git_repo, "a", "a") == (
+            "(No commits)"
+        )
+
+    def test_lists_commit_subjects(self, session_commits, git_backend):
+        """Lists one line per commit between the commits."""
+        project_dir, before, after = session_commits
+        messages = insight_extractor.get_commit_messages(project_dir, before, after)
+        lines = messages.splitlines()
+        assert len(lines) == 2
+        assert lines[0].endswith("Add util")
+        assert lines[1].endswith("Add app")
+
+    def test_limits_commit_count(self, session_commits, git_backend, monkeypatch):
+        """Only the most recent MAX_COMMITS_TO_INCLUDE commits are listed."""
+        project_dir, before, after = session_commits
+        monkeypatch.setattr(insight_extractor, "MAX_COMMITS_TO_INCLUDE", 1)
+        messages = insight_extractor.get_commit_messages(project_dir, before, after)
+        assert messages.endswith("Add util")
+        assert "Add app" not in messages
+
+    def test_limits_length(self, session_commits, git_backend, monkeypatch):
+        """Long output is cut at a line boundary."""
+        project_dir, before, after = session_commits
+        monkeypatch.setattr(insight_extractor, "MAX_COMMIT_MESSAGES_CHARS", 20)
+        messages = insight_extractor.get_commit_messages(project_dir, before, after)
+        assert messages.splitlines()[0].endswith("Add util")
+        assert messages.endswith("... (truncated)")
+
+
+class TestGatherGitInfo:
+    """Tests for _gather_git_info."""
+
+    def test_matches_individual_helpers(self, session_commits, git_backend):
+        """Returns the same results as calling each helper on its own."""
+        project_dir, before, after = session_commits
+        diff, files, messages = insight_extractor._gather_git_info(
+            project_dir, before, after
+        )
+        assert diff == insight_extractor.get_session_diff(project_dir, before, after)
+        assert files == insight_extractor.get_changed_files(project_dir, before, after)
+        assert messages == insight_extractor.get_commit_messages(
+            project_dir, before, after
+        )
+
+
+class TestRepoCache:
+    """Tests for the cached pygit2 repository handles."""
+
+    def test_repo_is_reused_and_freed(self, session_commits, git_backend):
+        """One repository is opened per project and released by _free_repos."""
+        if not git_backend:
+            pytest.skip("pygit2 backend only")
+        project_dir, before, after = session_commits
+        insight_extractor._gather_git_info(project_dir, before, after)
+        repo = insight_extractor._get_repo(project_dir)
+        assert insight_extractor._REPO_CACHE == {str(project_dir): repo}
+
+        insight_extractor._free_repos()
+        assert insight_extractor._REPO_CACHE == {}
+
+
+class TestGetSubtaskDescription:
+    """Tests for _get_subtask_description."""
+
+    def _write_plan(self, spec_dir: Path, description: str, mtime_ns: int) -> None:
+        plan_file = spec_dir / "implementation_plan.json"
+        plan = {
+            "phases": [{"subtasks": [{"id": "subtask-1", "description": description}]}]
+        }
+        plan_file.write_text(json.dumps(plan))
+        os.utime(plan_file, ns=(mtime_ns, mtime_ns))
+
+    def test_missing_plan(self, spec_dir):
+        """Falls back to the subtask ID without a plan."""
+        assert (
+            insight_extractor._get_subtask_description(spec_dir, "subtask-1")
+            == "Subtask: subtask-1"
+        )
+
+    def test_reloads_modified_plan(self, spec_dir):
+        """A plan rewritten during the run is read again."""
+        self._write_plan(spec_dir, "First", 1_000_000_000)
+        assert (
+            insight_extractor._get_subtask_description(spec_dir, "subtask-1") == "First"
+        )
+
+        self._write_plan(spec_dir, "Second", 2_000_000_000)
+        assert (
+            insight_extractor._get_subtask_description(spec_dir, "subtask-1")
+            == "Second"
+        )
+
+    def test_uses_shared_plan_cache(self, spec_dir):
+        """The plan is read through the shared implementation plan cache."""
+        self._write_plan(spec_dir, "Cached", 1_000_000_000)
+        plan_io.invalidate_plan_cache(spec_dir)
+        insight_extractor._get_subtask_description(spec_dir, "subtask-1")
+        assert str(spec_dir / "implementation_plan.json") in plan_io._PLAN_CACHE
+
+
+class TestBuildExtractionPrompt:
+    """Tests for _build_extraction_prompt."""
+
+    def test_includes_session_inputs(self):
+        """The session inputs are rendered into the prompt."""
+        inputs = {
+            "subtask_id": "subtask-1",
+            "subtask_description": "Do the thing",
+            "session_num": 1,
+            "success": True,
+            "changed_files": ["src/app.py"],
+            "commit_messages": "abc123 Add app",
+            "diff": "+print('hello')",
+            "attempt_history": [],
+        }
+        prompt = insight_extractor._build_extraction_prompt(inputs)
+        assert "- **ID**: subtask-1" in prompt
+        assert "- src/app.py" in prompt
+
+    def test_uses_prompt_file(self):
+        """The bundled extraction prompt is used instead of the fallback."""
+        assert insight_extractor.PROMPT_FILE.is_file()
+        inputs = {
+            "subtask_id": "subtask-1",
+            "subtask_description": "Do the thing",
+            "session_num": 1,
+            "success": True,
+            "changed_files": [],
+            "commit_messages": "",
+            "diff": "",
+            "attempt_history": [],
+        }
+        prompt = insight_extractor._build_extraction_prompt(inputs)
+        assert prompt.startswith(insight_extractor.PROMPT_FILE.read_text())
+
+
+class TestExtractSessionInsights:
+    """Tests for extract_session_insights short-circuits."""
+
+    @pytest.mark.asyncio
+    async def test_skips_llm_without_changes(
+        self, temp_git_repo, spec_dir, git_backend, monkeypatch
+    ):
+        """No commits and no changed files returns generic insights directly."""
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=temp_git_repo,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+
+        calls = []
+
+        async def record_extraction(*args, **kwargs):
+            calls.append(args)
+            return None
+
+        monkeypatch.setattr(insight_extractor, "is_extraction_enabled", lambda: True)
+        monkeypatch.setattr(
+            insight_extractor, "run_insight_extraction", record_extraction
+        )
+
+        insights = await insight_extractor.extract_session_insights(
+            spec_dir=spec_dir,
+            project_dir=temp_git_repo,
+            subtask_id="subtask-1",
+            session_num=1,
+            commit_before=None,
+            commit_after=head,
+            success=False,
+            recovery_manager=None,
+        )
+        assert insights == insight_extractor._get_generic_insights("subtask-1", False)
+        assert calls == []
+
+
+class TestAuthTokenCache:
+    """Tests for the cached auth token used by insight extraction."""
+
+    @pytest.mark.asyncio
+    async def test_failed_extraction_refreshes_token(self, monkeypatch):
+        """A failed extraction drops the token so the next run re-reads it."""
+        import core.simple_client
+
+        tokens = iter(["expired", "fresh"])
+        monkeypatch.setattr(insight_extractor, "SDK_AVAILABLE", True)
+        monkeypatch.setattr(insight_extractor, "get_auth_token", lambda: next(tokens))
+        monkeypatch.setattr(insight_extractor, "_cached_auth_token", None)
+        monkeypatch.setattr(
+            insight_extractor, "ensure_claude_code_oauth_token", lambda: None
+        )
+        monkeypatch.setattr(
+            insight_extractor, "_build_extraction_prompt", lambda inputs: "prompt"
+        )
+
+        def reject_token(**kwargs):
+            raise RuntimeError("401 Unauthorized")
+
+        monkeypatch.setattr(core.simple_client, "create_simple_client", reject_token)
+
+        assert insight_extractor._get_auth_token_cached() == "expired"
+        assert await insight_extractor.run_insight_extraction({}) is None
+        assert insight_extractor._get_auth_token_cached() == "fresh"
+
+
+class TestExtractionCache:
+    """Tests for the on-disk extraction cache."""
+
+    def test_round_trip(self, temp_dir):
+        """A saved extraction is loaded back for the same model and prompt."""
+        cache_path = insight_extractor._get_cache_path(temp_dir, "model", "prompt")
+        assert insight_extractor._load_cached_extraction(cache_path) is None
+
+        insight_extractor._save_cached_extraction(cache_path, {"file_insights": []})
+        assert insight_extractor._load_cached_extraction(cache_path) == {
+            "file_insights": []
+        }
+        assert cache_path != insight_extractor._get_cache_path(
+            temp_dir, "other-model", "prompt"
+        )
+
+    def test_evicts_least_recently_used(self, temp_dir, monkeypatch):
+        """Old entries are removed once the cache exceeds its limit."""
+        monkeypatch.setattr(insight_extractor, "MAX_CACHED_EXTRACTIONS", 2)
+        paths = [
+            insight_extractor._get_cache_path(temp_dir, "model", f"prompt {i}")
+            for i in range(3)
+        ]
+        for i, path in enumerate(paths):
+            insight_extractor._save_cached_extraction(path, {"n": i})
+            os.utime(path, (i, i))
+
+        assert not paths[0].exists()
+        assert paths[1].exists()
+        assert paths[2].exists()
+
+    @pytest.mark.parametrize("content", ['["a", "b"]', '"text"', '{"file_ins'])
+    def test_invalid_entry_discarded(self, temp_dir, content):
+        """Entries that aren't a JSON object are ignored and removed."""
+        cache_path = insight_extractor._get_cache_path(temp_dir, "model", "prompt")
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_text(content)
+
+        assert insight_extractor._load_cached_extraction(cache_path) is None
+        assert not cache_path.exists()
+
+
+class TestParseInsights:
+    """Tests for parse_insights."""
+
+    def test_plain_json(self):
+        """Plain JSON is parsed and missing keys get defaults."""
+        insights = insight_extractor.parse_insights('{"file_insights": [1]}')
+        assert insights["file_insights"] == [1]
+        assert insights["patterns_discovered"] == []
+        assert insights["approach_outcome"] == {}
+
+    def test_fenced_json(self):
+        """Markdown code fences around the JSON are stripped."""
+        insights = insight_extractor.parse_insights(
+            '```json\n{"recommendations": ["x"]}\n```'
+        )
+        assert insights["recommendations"] == ["x"]
+
+    def test_invalid_json(self):
+        """Unparseable responses return None."""
+        assert insight_extractor.parse_insights("not json") is None
+
+    def test_non_dict_json(self):
+        """JSON that is not an object returns None."""
+        assert insight_extractor.parse_insights("[1, 2]") is None
+
+
+class TestDiffFileLimit:
+    """Tests for limiting the session diff to the largest changes."""
+
+    def test_keeps_largest_files(
+        self, temp_git_repo, make_commit, git_backend, monkeypatch
+    ):
+        """Only the most-changed files are diffed when over MAX_DIFF_FILES."""
+        monkeypatch.setattr(insight_extractor, "MAX_DIFF_FILES", 1)
+        before = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=temp_git_repo,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        make_commit("small.py", "A = 1\n", "Add small")
+        after = make_commit("large.py", "B = 1\nC = 2\nD = 3\n", "Add large")
+
+        diff = insight_extractor.get_session_diff(temp_git_repo, before, after)
+        assert "large.py" in diff
+        assert "small.py" not in diff
+        assert "(1 smaller changed files not shown)" in diff
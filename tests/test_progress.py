@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Tests for Progress Tracking
+===========================
+
+Tests the plan-based progress helpers in core/progress.py.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from core import progress
+
+PLAN = {
+    "phases": [
+        {
+            "id": "p1",
+            "name": "Setup",
+            "subtasks": [
+                {"id": "s1", "status": "completed", "description": "First"},
+                {"id": "s2", "status": "pending", "description": "Second"},
+            ],
+        },
+        {
+            "id": "p2",
+            "name": "Build",
+            "depends_on": ["p1"],
+            "subtasks": [{"id": "s3", "status": "pending", "description": "Third"}],
+        },
+    ]
+}
+
+
+class TestGetNextSubtask:
+    """Tests for get_next_subtask and get_next_subtask_in_plan."""
+
+    def test_in_plan(self):
+        """Returns the first pending subtask whose phase dependencies are met."""
+        subtask = progress.get_next_subtask_in_plan(PLAN)
+        assert subtask["id"] == "s2"
+        assert subtask["phase_id"] == "p1"
+        assert subtask["phase_name"] == "Setup"
+
+    def test_from_file(self, spec_dir):
+        """Reads the plan from the spec directory."""
+        (spec_dir / "implementation_plan.json").write_text(json.dumps(PLAN))
+        assert progress.get_next_subtask(spec_dir)["id"] == "s2"
+
+    def test_missing_plan(self, spec_dir):
+        """Returns None without a plan file."""
+        assert progress.get_next_subtask(spec_dir) is None
+
+
+class TestPlanHelpers:
+    """Tests for the *_in_plan helpers."""
+
+    def test_is_build_complete_in_plan(self):
+        """Complete only when every subtask is completed."""
+        assert not progress.is_build_complete_in_plan(PLAN)
+        assert not progress.is_build_complete_in_plan({"phases": []})
+        done = {"phases": [{"subtasks": [{"id": "s1", "status": "completed"}]}]}
+        assert progress.is_build_complete_in_plan(done)
+
+    def test_get_current_phase_in_plan(self):
+        """The first phase with incomplete subtasks is current."""
+        phase = progress.get_current_phase_in_plan(PLAN)
+        assert phase["id"] == "p1"
+        assert (phase["completed"], phase["total"]) == (1, 2)
+
+    def test_file_variants_agree(self, spec_dir):
+        """The spec_dir helpers match the plan helpers."""
+        (spec_dir / "implementation_plan.json").write_text(json.dumps(PLAN))
+        assert progress.is_build_complete(spec_dir) is False
+        assert progress.get_current_phase(spec_dir) == (
+            progress.get_current_phase_in_plan(PLAN)
+        )
+
+    def test_spec_dir_helpers_share_tally(self, spec_dir, monkeypatch):
+        """Completion, counts and percentage for one plan walk it once."""
+        (spec_dir / "implementation_plan.json").write_text(json.dumps(PLAN))
+        calls = []
+        tally_plan = progress._tally_plan
+        monkeypatch.setattr(
+            progress, "_tally_plan", lambda plan: calls.append(1) or tally_plan(plan)
+        )
+
+        assert progress.is_build_complete(spec_dir) is False
+        assert progress.count_subtasks(spec_dir) == (1, 3)
+        assert progress.get_progress_percentage(spec_dir) == pytest.approx(100 / 3)
+        detailed = progress.count_subtasks_detailed(spec_dir)
+        detailed["completed"] = 99
+        assert progress.count_subtasks(spec_dir) == (1, 3)
+        assert len(calls) == 1
+
+
+class TestGetPlanSummary:
+    """Tests for get_plan_summary."""
+
+    def test_counts(self, spec_dir):
+        """Statuses are tallied overall and per phase."""
+        plan = {
+            "workflow_type": "feature",
+            "phases": [
+                {
+                    "id": "p1",
+                    "subtasks": [
+                        {"id": "a", "status": "completed"},
+                        {"id": "b", "status": "failed"},
+                        {"id": "c", "status": "blocked"},
+                    ],
+                },
+                {"id": "p2", "subtasks": [{"id": "d", "status": "in_progress"}]},
+            ],
+        }
+        (spec_dir / "implementation_plan.json").write_text(json.dumps(plan))
+
+        summary = progress.get_plan_summary(spec_dir)
+
+        assert summary["workflow_type"] == "feature"
+        assert summary["total_phases"] == 2
+        assert summary["total_subtasks"] == 4
+        assert summary["completed_subtasks"] == 1
+        assert summary["in_progress_subtasks"] == 1
+        assert summary["failed_subtasks"] == 1
+        assert summary["pending_subtasks"] == 1
+        assert [(p["completed"], p["total"]) for p in summary["phases"]] == [
+            (1, 3),
+            (0, 1),
+        ]
+        assert summary["phases"][0]["subtasks"][2]["status"] == "blocked"
+
+    def test_missing_plan(self, spec_dir):
+        """Without a plan everything is zero."""
+        summary = progress.get_plan_summary(spec_dir)
+        assert summary["total_subtasks"] == 0
+        assert summary["phases"] == []
+
+
+class TestPrintProgressSummary:
+    """Tests for print_progress_summary."""
+
+    def test_uses_given_plan(self, spec_dir, capsys):
+        """A pre-loaded plan is summarized without reading the plan file."""
+        counts = progress.print_progress_summary(spec_dir, plan=PLAN)
+        assert counts["completed"] == 1
+        assert counts["total"] == 3
+        out = capsys.readouterr().out
+        assert "2 subtasks remaining" in out
+        assert "s2" in out
+
+    def test_reports_change(self, spec_dir, capsys):
+        """Progress since the previous summary is shown."""
+        previous = {"completed": 0, "total": 3}
+        progress.print_progress_summary(spec_dir, plan=PLAN, previous=previous)
+        assert "+1 completed (0/3 -> 1/3)" in capsys.readouterr().out
+
+    def test_phase_statuses(self, spec_dir, monkeypatch):
+        """Phases are reported complete, in progress, pending or blocked."""
+        plan = {
+            "phases": [
+                {"id": "p1", "subtasks": [{"id": "a", "status": "completed"}]},
+                {"id": "p2", "subtasks": [{"id": "b", "status": "in_progress"}]},
+                {"id": "p3", "depends_on": ["p1"], "subtasks": [{"id": "c"}]},
+                {"id": "p4", "depends_on": ["p2"], "subtasks": [{"id": "d"}]},
+            ]
+        }
+        reported = []
+        monkeypatch.setattr(
+            progress,
+            "print_phase_status",
+            lambda name, done, total, status: reported.append((name, status)),
+        )
+        progress.print_progress_summary(spec_dir, plan=plan, show_next=False)
+        assert reported == [
+            ("p1", "complete"),
+            ("p2", "in_progress"),
+            ("p3", "pending"),
+            ("p4", "blocked"),
+        ]
+
+    def test_no_plan(self, spec_dir, capsys):
+        """Without a plan the planner hint is shown."""
+        counts = progress.print_progress_summary(spec_dir)
+        assert counts["total"] == 0
+        assert "planner needs to run" in capsys.readouterr().out
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Tests for Prompt Generator
+==========================
+
+Tests subtask context loading in prompts_pkg/prompt_generator.py.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from prompts_pkg import prompt_generator
+
+
+class TestEnvironmentContext:
+    """Tests for get_relative_spec_path and generate_environment_context."""
+
+    def test_relative_spec_path(self, temp_dir):
+        """Spec paths are made relative to the project when possible."""
+        spec = temp_dir / ".auto-claude" / "specs" / "001-feature"
+        assert prompt_generator.get_relative_spec_path(spec, temp_dir) == (
+            "./.auto-claude/specs/001-feature"
+        )
+        assert prompt_generator.get_relative_spec_path(spec, temp_dir / "other") == (
+            "./auto-claude/specs/001-feature"
+        )
+
+    def test_environment_context_reused(self, temp_dir, spec_dir):
+        """The header is rendered once per (project_dir, spec_dir) pair."""
+        first = prompt_generator.generate_environment_context(temp_dir, spec_dir)
+        assert f"**Working Directory:** `{temp_dir}`" in first
+        assert (
+            prompt_generator.generate_environment_context(temp_dir, spec_dir) is first
+        )
+
+
+class TestLoadSubtaskContext:
+    """Tests for load_subtask_context."""
+
+    def test_loads_and_truncates(self, temp_dir, spec_dir):
+        """Existing files are loaded, long files truncated, missing ones skipped."""
+        (temp_dir / "short.py").write_text("a\nb")
+        (temp_dir / "long.py").write_text("\n".join(str(i) for i in range(10)))
+        subtask = {
+            "patterns_from": ["short.py", "missing.py"],
+            "files_to_modify": ["long.py"],
+        }
+
+        context = prompt_generator.load_subtask_context(
+            spec_dir, temp_dir, subtask, max_file_lines=5
+        )
+
+        assert context["patterns"] == {"short.py": "a\nb"}
+        assert context["files_to_modify"]["long.py"] == (
+            "0\n1\n2\n3\n4\n\n... (truncated, 5 more lines)"
+        )
+        assert context["spec_excerpt"] is None
+
+    def test_truncation_boundary(self, temp_dir, spec_dir):
+        """Files with exactly max_file_lines lines are kept whole."""
+        (temp_dir / "exact.py").write_text("1\n2\n3\n")
+        subtask = {"files_to_modify": ["exact.py"]}
+
+        context = prompt_generator.load_subtask_context(
+            spec_dir, temp_dir, subtask, max_file_lines=4
+        )
+        assert context["files_to_modify"]["exact.py"] == "1\n2\n3\n"
+
+        context = prompt_generator.load_subtask_context(
+            spec_dir, temp_dir, subtask, max_file_lines=3
+        )
+        assert context["files_to_modify"]["exact.py"] == (
+            "1\n2\n3\n\n... (truncated, 1 more lines)"
+        )
+
+    def test_crlf_line_endings(self, temp_dir, spec_dir):
+        """Windows line endings are normalized before truncating."""
+        (temp_dir / "crlf.py").write_bytes(b"a\r\nb\r\nc\r\n")
+        subtask = {"files_to_modify": ["crlf.py"]}
+
+        context = prompt_generator.load_subtask_context(
+            spec_dir, temp_dir, subtask, max_file_lines=2
+        )
+        assert context["files_to_modify"]["crlf.py"] == (
+            "a\nb\n\n... (truncated, 2 more lines)"
+        )
+
+    def test_modified_files_reloaded(self, temp_dir, spec_dir):
+        """Cached excerpts are refreshed when the file changes."""
+        target = temp_dir / "target.py"
+        target.write_text("old")
+        os.utime(target, ns=(1_000_000_000, 1_000_000_000))
+        subtask = {"files_to_modify": ["target.py"]}
+
+        context = prompt_generator.load_subtask_context(spec_dir, temp_dir, subtask)
+        assert context["files_to_modify"]["target.py"] == "old"
+
+        target.write_text("new")
+        os.utime(target, ns=(2_000_000_000, 2_000_000_000))
+        context = prompt_generator.load_subtask_context(spec_dir, temp_dir, subtask)
+        assert context["files_to_modify"]["target.py"] == "new"
+
+
+class TestGenerateSubtaskPrompt:
+    """Tests for generate_subtask_prompt."""
+
+    def test_sections(self, temp_dir, spec_dir):
+        """Subtask details, file lists and retry hints are rendered."""
+        subtask = {
+            "id": "subtask-1",
+            "description": "Add the endpoint",
+            "files_to_modify": ["app.py"],
+            "patterns_from": ["routes.py"],
+            "verification": {"type": "e2e", "steps": ["Start", "Check"]},
+        }
+
+        prompt = prompt_generator.generate_subtask_prompt(
+            spec_dir,
+            temp_dir,
+            subtask,
+            {"name": "Backend"},
+            attempt_count=1,
+            recovery_hints=["Try a different import"],
+        )
+
+        assert "**Subtask ID:** `subtask-1`" in prompt
+        assert "**Phase:** Backend" in prompt
+        assert "## ⚠️ RETRY ATTEMPT (2)" in prompt
+        assert "- Try a different import" in prompt
+        assert "**Files to Modify:**\n- `app.py`\n" in prompt
+        assert "**Pattern Files (study these first):**\n- `routes.py`\n" in prompt
+        assert "1. Start\n2. Check\n" in prompt
+        assert 'git commit -m "auto-claude: subtask-1 - Add the endpoint"' in prompt
+
+    def test_api_verification(self, temp_dir, spec_dir):
+        """API verification renders a curl command with the JSON body."""
+        subtask = {
+            "id": "s1",
+            "verification": {
+                "type": "api",
+                "method": "POST",
+                "url": "http://localhost/items",
+                "body": {"name": "x"},
+                "expected_status": 201,
+            },
+        }
+
+        prompt = prompt_generator.generate_subtask_prompt(
+            spec_dir, temp_dir, subtask, {"id": "p1"}
+        )
+
+        assert (
+            "curl -X POST http://localhost/items "
+            '-H "Content-Type: application/json" -d \'{"name": "x"}\''
+        ) in prompt
+        assert "Expected status: 201" in prompt
+        assert "RETRY ATTEMPT" not in prompt
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
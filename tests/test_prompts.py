@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for Prompt Loading
+========================
+
+Tests prompt file loading in prompts_pkg/prompts.py.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from prompts_pkg import prompts
+
+
+class TestReadPromptText:
+    """Tests for the cached prompt file reader."""
+
+    def test_cached_until_modified(self, temp_dir):
+        """Unchanged prompt files are served from cache; edits are picked up."""
+        prompt_file = temp_dir / "prompt.md"
+        prompt_file.write_text("first")
+        os.utime(prompt_file, ns=(1_000_000_000, 1_000_000_000))
+        assert prompts._read_prompt_text(prompt_file) == "first"
+
+        hits = prompts._read_cached.cache_info().hits
+        assert prompts._read_prompt_text(prompt_file) == "first"
+        assert prompts._read_cached.cache_info().hits == hits + 1
+
+        prompt_file.write_text("second")
+        os.utime(prompt_file, ns=(2_000_000_000, 2_000_000_000))
+        assert prompts._read_prompt_text(prompt_file) == "second"
+
+    def test_coding_prompt_uses_prompt_file(self, spec_dir):
+        """The coder prompt includes the spec location and the coder.md text."""
+        prompt = prompts.get_coding_prompt(spec_dir)
+        assert f"`{spec_dir}/spec.md`" in prompt
+        assert prompt.endswith((prompts.PROMPTS_DIR / "coder.md").read_text())
+
+    def test_coding_prompt_human_input(self, spec_dir):
+        """HUMAN_INPUT.md is included only when it has content."""
+        assert "HUMAN INPUT" not in prompts.get_coding_prompt(spec_dir)
+
+        human_input = spec_dir / "HUMAN_INPUT.md"
+        human_input.write_text("  \n")
+        assert "HUMAN INPUT" not in prompts.get_coding_prompt(spec_dir)
+
+        human_input.write_text("Use the existing logger.\n")
+        prompt = prompts.get_coding_prompt(spec_dir)
+        assert "## HUMAN INPUT (READ THIS FIRST!)" in prompt
+        assert "Use the existing logger." in prompt
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -16,6 +16,7 @@ import tempfile
 import shutil
 from pathlib import Path
 from datetime import datetime
+from unittest.mock import patch
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -354,6 +355,76 @@ def test_recovery_hints():
         cleanup_test_environment(temp_dir)
 
 
+def test_attempt_history_cache():
+    """Test that attempt history is cached until the file changes."""
+    print("TEST: Attempt History Cache")
+
+    temp_dir, spec_dir, project_dir = setup_test_environment()
+
+    try:
+        manager = RecoveryManager(spec_dir, project_dir)
+        manager.record_attempt("subtask-1", 1, False, "First approach", "Error")
+
+        # Repeated lookups are served from memory
+        manager._load_attempt_history()
+        cached = manager._history_cache
+        manager._load_attempt_history()
+        assert manager._history_cache is cached, "History not cached"
+        assert manager.get_attempt_count("subtask-1") == 1, "Wrong attempt count"
+
+        # External edits to the file are picked up
+        history_file = spec_dir / "memory" / "attempt_history.json"
+        with open(history_file) as f:
+            history = json.load(f)
+        history["subtasks"]["subtask-1"]["attempts"].append(
+            {"session": 2, "approach": "External", "success": False, "error": None}
+        )
+        with open(history_file, "w") as f:
+            json.dump(history, f)
+
+        assert manager.get_attempt_count("subtask-1") == 2, "External edit not seen"
+
+        # record_attempt reports the updated count
+        count = manager.record_attempt("subtask-1", 3, False, "Third approach", "Error")
+        assert count == 3, "record_attempt returned wrong count"
+
+        print("  ✓ Attempt history cache works")
+        print()
+
+    finally:
+        cleanup_test_environment(temp_dir)
+
+
+def test_attempt_history_copies():
+    """Test that mutating returned history leaves the cache untouched."""
+    print("TEST: Attempt History Copies")
+
+    temp_dir, spec_dir, project_dir = setup_test_environment()
+
+    try:
+        manager = RecoveryManager(spec_dir, project_dir)
+        manager.record_attempt("subtask-1", 1, False, "First approach", "Error")
+        manager.mark_subtask_stuck("subtask-1", "Stuck")
+
+        manager.get_subtask_history("subtask-1")["attempts"].clear()
+        manager.get_stuck_subtasks().clear()
+        manager._load_attempt_history()["subtasks"].clear()
+
+        assert manager.get_attempt_count("subtask-1") == 1, "Cached attempts mutated"
+
+        # Counting reads the cache without copying it
+        with patch("copy.deepcopy", side_effect=AssertionError("history copied")):
+            assert manager.get_attempt_count("subtask-1") == 1
+        assert len(manager.get_stuck_subtasks()) == 1, "Cached stuck list mutated"
+        assert manager.get_subtask_history("subtask-1")["status"] == "stuck"
+
+        print("  ✓ Returned history is independent of the cache")
+        print()
+
+    finally:
+        cleanup_test_environment(temp_dir)
+
+
 def run_all_tests():
     """Run all tests."""
     print("=" * 70)
@@ -370,6 +441,8 @@ def run_all_tests():
         test_good_commit_tracking,
         test_mark_subtask_stuck,
         test_recovery_hints,
+        test_attempt_history_cache,
+        test_attempt_history_copies,
     ]
 
     passed = 0
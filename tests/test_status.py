@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for Status Management
+===========================
+
+Tests the StatusManager status-file writes in ui/status.py.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from ui.status import BuildState, StatusManager
+
+
+class TestStatusManager:
+    """Tests for StatusManager write batching."""
+
+    def test_batch_writes_once(self, temp_dir, monkeypatch):
+        """Updates inside batch() produce a single write when it exits."""
+        manager = StatusManager(temp_dir)
+        writes = []
+        monkeypatch.setattr(manager, "_schedule_write", lambda: writes.append(1))
+
+        with manager.batch():
+            manager.update_session(2)
+            manager.update_phase("Setup", 1, 3)
+            manager.update_subtasks(in_progress=1)
+            assert writes == []
+
+        assert writes == [1]
+
+    def test_nested_batch(self, temp_dir, monkeypatch):
+        """Only the outermost batch triggers the write."""
+        manager = StatusManager(temp_dir)
+        writes = []
+        monkeypatch.setattr(manager, "_schedule_write", lambda: writes.append(1))
+
+        with manager.batch():
+            with manager.batch():
+                manager.update_session(2)
+            assert writes == []
+        assert writes == [1]
+
+    def test_batch_without_updates(self, temp_dir, monkeypatch):
+        """An empty batch does not write."""
+        manager = StatusManager(temp_dir)
+        writes = []
+        monkeypatch.setattr(manager, "_schedule_write", lambda: writes.append(1))
+
+        with manager.batch():
+            pass
+        assert writes == []
+
+    def test_write_refreshes_timestamp(self, temp_dir):
+        """Every write advances last_update, even with no other change."""
+        manager = StatusManager(temp_dir)
+        manager.set_active("001-spec", BuildState.BUILDING)
+        manager._status.last_update = "stale"
+
+        manager.write(immediate=True)
+        data = json.loads(manager.status_file.read_text())
+        assert data["last_update"] != "stale"
+        assert data["active"] is True
+
+    def test_batch_absorbs_pending_write(self, temp_dir):
+        """A debounced write scheduled before batch() waits for it to exit."""
+        manager = StatusManager(temp_dir)
+        manager.update_session(2)
+
+        with manager.batch():
+            assert manager._write_timer is None
+            manager.update_session(3)
+            manager._do_write()
+            assert not manager.status_file.exists()
+
+        manager.flush()
+        assert json.loads(manager.status_file.read_text())["session"]["number"] == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])